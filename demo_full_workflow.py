@@ -21,7 +21,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.entities import Task
 from src.composition import compose_dependencies
-from src.factories import AgentFactory, ProviderFactory
+from src.factories import AgentFactory
+from src.factories.provider_factory import get_default_factory
 from src.adapters.cli import ResultFormatter
 from src.tools import DEV_TOOLS, TOOL_FUNCTIONS
 
@@ -69,7 +70,7 @@ async def run_workflow():
 
     # Create factories (DIP)
     agent_factory = AgentFactory()
-    provider_factory = ProviderFactory()
+    provider_factory = get_default_factory()
 
     # Create agents
     agents = agent_factory.create_default_agents()
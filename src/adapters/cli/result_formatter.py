@@ -8,13 +8,21 @@ Enhanced with Rich library for structured error display (Week 2).
 """
 
 import click
-from typing import List, Optional, Dict, Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from src.entities import ExecutionResult, ExecutionStatus
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Pre-styled status lines, built once at import (ANSI wrapping is not per-result)
+_STATUS_LINES: Dict[ExecutionStatus, str] = {
+    status: click.style(
+        f"Status: {status.value}",
+        fg="green" if status is ExecutionStatus.SUCCESS else "red"
+    )
+    for status in ExecutionStatus
+}
+
 
 class ResultFormatter:
     """
@@ -32,7 +40,16 @@ class ResultFormatter:
             verbose: Enable detailed output
         """
         self.verbose = verbose
-        self.console = Console()  # Rich console for enhanced formatting
+        self._console: Optional["Console"] = None
+
+    @property
+    def console(self) -> "Console":
+        """Rich console for enhanced formatting, created on first error table."""
+        if self._console is None:
+            # Lazy: Rich is only needed for structured error details
+            from rich.console import Console
+            self._console = Console()
+        return self._console
 
     def format_results(self, results: List[ExecutionResult]) -> None:
         """
@@ -41,51 +58,77 @@ class ResultFormatter:
         Clean Code: Orchestrates formatting sub-methods.
         Enhanced: Now displays error_details with Rich formatting (Week 2).
 
+        Lines are buffered and written with one echo per call (plus one
+        flush before each Rich error table, to keep output ordered).
+
         Args:
             results: List of execution results to display
         """
-        for i, result in enumerate(results):
-            self._display_result_header(i + 1)
-            self._display_status(result.status)
-            self._display_output(result.output)
+        lines: List[str] = []
+        for number, result in enumerate(results, start=1):
+            self._add_result(lines, number, result)
 
-            # Week 2: Display structured error details if present
-            if result.error_details:
-                self._display_error_details(result.error_details)
-            elif result.errors:
-                self._display_errors(result.errors)
+        self._flush(lines)
 
-            if self.verbose:
-                self._display_metadata(result.metadata)
-
-    def _display_result_header(self, number: int) -> None:
+    def format_result(self, number: int, result: ExecutionResult) -> None:
         """
-        Display result section header.
+        Display a single execution result (streaming display).
+
+        Args:
+            number: 1-based result number shown in the header
+            result: Execution result to display
+        """
+        lines: List[str] = []
+        self._add_result(lines, number, result)
+        self._flush(lines)
+
+    def _add_result(self, lines: List[str], number: int, result: ExecutionResult) -> None:
+        """Append a result's formatted lines to the buffer."""
+        lines.append(self._format_result_header(number))
+        lines.append(self._format_status(result.status))
+        if result.output:
+            lines.append(self._format_output(result.output))
+
+        # Week 2: Display structured error details if present
+        if result.error_details:
+            # Rich renders through its own console: flush buffered text first
+            self._flush(lines)
+            self._display_error_details(result.error_details)
+        elif result.errors:
+            lines.append(self._format_errors(result.errors))
+
+        if self.verbose and result.metadata:
+            lines.append(f"Metadata: {result.metadata}")
+
+    @staticmethod
+    def _flush(lines: List[str]) -> None:
+        """Write buffered lines in a single echo and clear the buffer."""
+        if lines:
+            click.echo("\n".join(lines))
+            lines.clear()
+
+    def _format_result_header(self, number: int) -> str:
+        """
+        Format result section header.
 
         Clean Code: Extract method for clarity.
         """
-        click.echo(f"\n{'=' * 40}")
-        click.echo(f"Result #{number}")
-        click.echo(f"{'=' * 40}")
+        return f"\n{'=' * 40}\nResult #{number}\n{'=' * 40}"
 
-    def _display_status(self, status: ExecutionStatus) -> None:
+    def _format_status(self, status: ExecutionStatus) -> str:
         """
-        Display execution status with color coding.
+        Format execution status with color coding.
 
         Clean Code: Single responsibility - status display.
         """
-        color = "green" if status == ExecutionStatus.SUCCESS else "red"
-        click.echo(click.style(f"Status: {status.value}", fg=color))
+        return _STATUS_LINES[status]
 
-    def _display_output(self, output: Optional[str]) -> None:
+    def _format_output(self, output: str) -> str:
         """
-        Display execution output, truncated if not verbose.
+        Format execution output, truncated if not verbose.
 
         Clean Code: Extract method for output handling.
         """
-        if not output:
-            return
-
         # Truncate output unless verbose mode (increased from 200 to 1000 for ULTRATHINK)
         max_length = None if self.verbose else 1000
         display_output = output
@@ -93,17 +136,16 @@ class ResultFormatter:
         if max_length and len(output) > max_length:
             display_output = output[:500] + f"\n... ({len(output)-1000} chars truncated) ...\n" + output[-500:]
 
-        click.echo(f"Output: {display_output}")
+        return f"Output: {display_output}"
 
-    def _display_errors(self, errors: List[str]) -> None:
+    def _format_errors(self, errors: List[str]) -> str:
         """
-        Display errors in red (fallback for simple errors).
+        Format errors in red (fallback for simple errors).
 
         Clean Code: Extract method for error display.
         """
-        if errors:
-            error_text = ", ".join(errors)
-            click.echo(click.style(f"Errors: {error_text}", fg="red"))
+        error_text = ", ".join(errors)
+        return click.style(f"Errors: {error_text}", fg="red")
 
     def _display_error_details(self, error_details: Dict[str, Any]) -> None:
         """
@@ -115,6 +157,9 @@ class ResultFormatter:
         Args:
             error_details: Structured error information
         """
+        from rich import box
+        from rich.table import Table
+
         # Create Rich table for error details
         table = Table(
             title=f"❌ {error_details.get('error_type', 'Error')}",
@@ -140,15 +185,6 @@ class ResultFormatter:
 
         self.console.print(table)
 
-    def _display_metadata(self, metadata: Optional[dict]) -> None:
-        """
-        Display metadata in verbose mode.
-
-        Clean Code: Extract method for metadata display.
-        """
-        if metadata:
-            click.echo(f"Metadata: {metadata}")
-
     def format_error(self, message: str, error_type: str = "Error") -> None:
         """
         Display error message.
@@ -6,15 +6,12 @@ from src.entities import Agent, AgentTeam, MetricsCollector
 from src.use_cases.task_planner import TaskPlannerUseCase
 from src.use_cases.task_coordinator import TaskCoordinatorUseCase
 from src.adapters.agent.capability_selector import CapabilityBasedSelector
-from src.adapters.agent.team_selector import TeamBasedSelector
 from src.adapters.agent.llm_executor import LLMAgentExecutor
 from src.interfaces import ITextGenerator, IAgentCoordinator
-from src.factories.provider_factory import ProviderFactory
+from src.factories.provider_factory import get_default_factory
 from src.factories.agent_factory import AgentFactory
-from src.factories.orchestration_factory import OrchestrationFactory
+from src.factories.orchestration_factory import create_orchestrator
 from src.utils.data_collector import DataCollector
-from src.routing.domain_classifier import DomainClassifier
-from src.routing.team_router import TeamRouter
 
 
 def compose_dependencies(
@@ -77,6 +74,11 @@ def compose_dependencies(
 
     # Week 12/13: Create agent selector based on routing mode (with metrics integration)
     if routing_mode == "team" and teams:
+        # Lazy: routing modules are only needed for team routing
+        from src.adapters.agent.team_selector import TeamBasedSelector
+        from src.routing.domain_classifier import DomainClassifier
+        from src.routing.team_router import TeamRouter
+
         # Create domain classifier with metrics integration
         domain_classifier = DomainClassifier(metrics_collector=metrics_collector)
         team_router = TeamRouter(domain_classifier=domain_classifier)
@@ -96,7 +98,7 @@ def compose_dependencies(
     )
 
     # Create coordinator via factory (Week 7: supports multiple orchestration modes)
-    coordinator = OrchestrationFactory.create_orchestrator(
+    coordinator = create_orchestrator(
         mode=orchestrator_mode,
         llm_provider=llm_provider,
         task_planner=task_planner,
@@ -127,7 +129,7 @@ def create_coordinator(
     """
     # Create factories
     agent_factory = AgentFactory()
-    provider_factory = ProviderFactory()
+    provider_factory = get_default_factory()
 
     # Create dependencies via factories
     agents = agent_factory.create_default_agents()
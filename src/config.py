@@ -4,18 +4,22 @@ Configuration management for Unified Intelligence CLI.
 Supports JSON config files for runtime provider and agent configuration.
 """
 
+import copy
+import functools
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """
     Application configuration.
 
     Supports loading from JSON file with CLI argument override.
+    Immutable: merge_cli_args() returns a new Config instead of editing
+    this one.
     """
 
     # LLM Provider settings
@@ -60,14 +64,14 @@ class Config:
         """
         path = Path(file_path)
 
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except OSError:
             raise ValueError(f"Config file not found: {file_path}")
 
-        try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in config file: {e}")
+        # Re-parse only when the file changes (mtime/size are part of the key);
+        # each call gets its own copy, so nested dicts are never shared
+        data = copy.deepcopy(_read_config_file(str(path), stat.st_mtime_ns, stat.st_size))
 
         return cls(
             provider=data.get("provider", "mock"),
@@ -123,22 +127,21 @@ class Config:
         Returns:
             New Config with merged values
         """
-        return Config(
-            provider=provider if provider is not None else self.provider,
-            provider_config=self.provider_config,
-            parallel=parallel if parallel is not None else self.parallel,
-            timeout=timeout if timeout is not None else self.timeout,
-            verbose=verbose if verbose is not None else self.verbose,
-            debug=debug if debug is not None else self.debug,
-            orchestrator=orchestrator if orchestrator is not None else self.orchestrator,
-            collect_data=collect_data if collect_data is not None else self.collect_data,
-            data_dir=data_dir if data_dir is not None else self.data_dir,
-            agent_mode=agent_mode if agent_mode is not None else self.agent_mode,
-            custom_agents=self.custom_agents,
-            routing_mode=routing_mode if routing_mode is not None else self.routing_mode,
-            collect_metrics=collect_metrics if collect_metrics is not None else self.collect_metrics,
-            metrics_dir=metrics_dir if metrics_dir is not None else self.metrics_dir
-        )
+        overrides: Dict[str, Any] = {
+            "provider": provider,
+            "parallel": parallel,
+            "timeout": timeout,
+            "verbose": verbose,
+            "debug": debug,
+            "orchestrator": orchestrator,
+            "collect_data": collect_data,
+            "data_dir": data_dir,
+            "agent_mode": agent_mode,
+            "routing_mode": routing_mode,
+            "collect_metrics": collect_metrics,
+            "metrics_dir": metrics_dir,
+        }
+        return replace(self, **{name: value for name, value in overrides.items() if value is not None})
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -161,4 +164,23 @@ class Config:
             "routing_mode": self.routing_mode,
             "collect_metrics": self.collect_metrics,
             "metrics_dir": self.metrics_dir
-        }
\ No newline at end of file
+        }
+
+
+@functools.lru_cache(maxsize=4)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a JSON config file (memoized per file version).
+
+    Callers must copy the result before building on it.
+
+    Raises:
+        ValueError: If the file is invalid JSON
+    """
+    try:
+        with open(path, 'r') as f:
+            data: Dict[str, Any] = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in config file: {e}")
+
+    return data
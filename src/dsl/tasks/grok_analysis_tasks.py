@@ -132,10 +132,10 @@ async def analyze_commit_with_grok(input_data: Any = None) -> Dict[str, Any]:
 
     try:
         # Import provider here to avoid circular dependencies
-        from src.factories.provider_factory import ProviderFactory
+        from src.factories.provider_factory import get_default_factory
 
-        # Create provider factory and get Grok provider
-        factory = ProviderFactory()
+        # Use shared provider factory and get Grok provider
+        factory = get_default_factory()
         provider = factory.create_provider('grok', config=None)
 
         # Prepare analysis prompt
@@ -3,7 +3,7 @@ import difflib
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Task:
     description: str
     priority: int = 1
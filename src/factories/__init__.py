@@ -2,7 +2,13 @@
 
 from .agent_factory import AgentFactory
 from .provider_factory import ProviderFactory
-from .orchestration_factory import OrchestrationFactory
+from .orchestration_factory import OrchestrationFactory, OrchestrationMode
 from .team_factory import TeamFactory
 
-__all__ = ["AgentFactory", "ProviderFactory", "OrchestrationFactory", "TeamFactory"]
\ No newline at end of file
+__all__ = [
+    "AgentFactory",
+    "ProviderFactory",
+    "OrchestrationFactory",
+    "OrchestrationMode",
+    "TeamFactory",
+]
\ No newline at end of file
@@ -10,13 +10,16 @@ Architecture:
 - DIP: Returns IAgentCoordinator interface (abstraction)
 """
 
+from __future__ import annotations
+
 import os
 import logging
-from typing import List, Optional
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
-from src.entities import Agent
-from src.interfaces import IAgentCoordinator, ITextGenerator, IAgentExecutor, ITaskPlanner
-from src.use_cases.task_coordinator import TaskCoordinatorUseCase
+if TYPE_CHECKING:
+    from src.entities import Agent
+    from src.interfaces import IAgentCoordinator, ITextGenerator, IAgentExecutor, ITaskPlanner
 
 # Optional: OpenAI Agents SDK
 try:
@@ -30,226 +33,273 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-class OrchestrationFactory:
-    """
-    Factory for creating orchestrators.
+class OrchestrationMode(str, Enum):
+    """Supported orchestration modes (members compare equal to their CLI names)."""
+    SIMPLE = "simple"
+    OPENAI_AGENTS = "openai-agents"
+    HYBRID = "hybrid"
 
-    Clean Architecture: Factory pattern for dependency creation.
-    DIP: Returns IAgentCoordinator interface (callers depend on abstraction).
-
-    Supported modes:
-    - "simple": TaskCoordinatorUseCase (current, default)
-    - "openai-agents": OpenAIAgentsSDKAdapter (Week 7, Phase 1)
-    - "hybrid": HybridOrchestrator (Week 10, Phase 2 - intelligent routing)
-    """
+    @classmethod
+    def parse(cls, mode: Union[str, "OrchestrationMode"]) -> "OrchestrationMode":
+        """
+        Validate a mode name (case-insensitive) into an OrchestrationMode.
 
-    @staticmethod
-    def create_orchestrator(
-        mode: str,
-        llm_provider: ITextGenerator,
-        task_planner: ITaskPlanner,
-        agent_executor: IAgentExecutor,
-        agents: List[Agent],
-        logger_instance: Optional[logging.Logger] = None
-    ) -> IAgentCoordinator:
+        Raises:
+            ValueError: If mode is unsupported
         """
-        Create orchestrator based on mode.
+        if isinstance(mode, cls):
+            return mode
+        try:
+            return cls(mode.lower())
+        except ValueError:
+            raise ValueError(
+                f"Unsupported orchestration mode: '{mode}'. "
+                f"Supported modes: {', '.join(member.value for member in cls)}"
+            ) from None
+
+
+def create_orchestrator(
+    mode: Union[str, OrchestrationMode],
+    llm_provider: ITextGenerator,
+    task_planner: ITaskPlanner,
+    agent_executor: IAgentExecutor,
+    agents: List[Agent],
+    logger_instance: Optional[logging.Logger] = None
+) -> IAgentCoordinator:
+    """
+    Create orchestrator based on mode.
 
-        Factory Method: Creates appropriate concrete class for mode.
-        DIP: Returns IAgentCoordinator interface.
+    Factory Method: Creates appropriate concrete class for mode.
+    DIP: Returns IAgentCoordinator interface.
 
-        Args:
-            mode: Orchestration mode ("simple", "openai-agents", or "hybrid")
-            llm_provider: LLM provider (Tongyi, Mock, etc.)
-            task_planner: Task planning strategy
-            agent_executor: Agent execution strategy
-            agents: Available agents
-            logger_instance: Optional logger
+    Args:
+        mode: Orchestration mode ("simple", "openai-agents", "hybrid",
+            or an OrchestrationMode member)
+        llm_provider: LLM provider (Tongyi, Mock, etc.)
+        task_planner: Task planning strategy
+        agent_executor: Agent execution strategy
+        agents: Available agents
+        logger_instance: Optional logger
 
-        Returns:
-            IAgentCoordinator implementation
+    Returns:
+        IAgentCoordinator implementation
 
-        Raises:
-            ValueError: If mode is unsupported
-        """
-        mode = mode.lower()
+    Raises:
+        ValueError: If mode is unsupported
+    """
+    mode = OrchestrationMode.parse(mode)
+
+    logger.info("Creating orchestrator: mode=%s", mode.value)
+
+    builder = _ORCHESTRATOR_BUILDERS[mode]
+    return builder(
+        llm_provider=llm_provider,
+        task_planner=task_planner,
+        agent_executor=agent_executor,
+        agents=agents,
+        logger_instance=logger_instance
+    )
+
+
+def _create_simple_orchestrator(
+    llm_provider: ITextGenerator,
+    task_planner: ITaskPlanner,
+    agent_executor: IAgentExecutor,
+    agents: List[Agent],
+    logger_instance: Optional[logging.Logger]
+) -> IAgentCoordinator:
+    """
+    Create simple orchestrator (current system).
 
-        logger.info(f"Creating orchestrator: mode={mode}")
+    Args:
+        llm_provider: LLM provider (unused, shared builder signature)
+        task_planner: Task planning strategy
+        agent_executor: Agent execution strategy
+        agents: Available agents (unused, shared builder signature)
+        logger_instance: Optional logger
 
-        if mode == "simple":
-            return OrchestrationFactory._create_simple_orchestrator(
-                task_planner=task_planner,
-                agent_executor=agent_executor,
-                logger_instance=logger_instance
-            )
+    Returns:
+        TaskCoordinatorUseCase instance
+    """
+    logger.info("Creating simple orchestrator (TaskCoordinatorUseCase)")
 
-        elif mode == "openai-agents":
-            if not OPENAI_AGENTS_AVAILABLE:
-                logger.warning(
-                    "OpenAI Agents SDK not available, falling back to simple mode. "
-                    "Install with: pip install openai-agents"
-                )
-                return OrchestrationFactory._create_simple_orchestrator(
-                    task_planner=task_planner,
-                    agent_executor=agent_executor,
-                    logger_instance=logger_instance
-                )
-
-            return OrchestrationFactory._create_openai_agents_orchestrator(
-                llm_provider=llm_provider,
-                agents=agents
-            )
+    from src.use_cases.task_coordinator import TaskCoordinatorUseCase
 
-        elif mode == "hybrid":
-            return OrchestrationFactory._create_hybrid_orchestrator(
-                llm_provider=llm_provider,
-                task_planner=task_planner,
-                agent_executor=agent_executor,
-                agents=agents,
-                logger_instance=logger_instance
-            )
+    return TaskCoordinatorUseCase(
+        task_planner=task_planner,
+        agent_executor=agent_executor,
+        max_retries=3,
+        logger=logger_instance
+    )
 
-        else:
-            raise ValueError(
-                f"Unsupported orchestration mode: '{mode}'. "
-                f"Supported modes: simple, openai-agents, hybrid"
-            )
 
-    @staticmethod
-    def _create_simple_orchestrator(
-        task_planner: ITaskPlanner,
-        agent_executor: IAgentExecutor,
-        logger_instance: Optional[logging.Logger]
-    ) -> IAgentCoordinator:
-        """
-        Create simple orchestrator (current system).
+def _create_openai_agents_orchestrator(
+    llm_provider: ITextGenerator,
+    task_planner: ITaskPlanner,
+    agent_executor: IAgentExecutor,
+    agents: List[Agent],
+    logger_instance: Optional[logging.Logger]
+) -> IAgentCoordinator:
+    """
+    Create OpenAI Agents SDK orchestrator.
 
-        Args:
-            task_planner: Task planning strategy
-            agent_executor: Agent execution strategy
-            logger_instance: Optional logger
+    Falls back to the simple orchestrator when the SDK is not installed.
 
-        Returns:
-            TaskCoordinatorUseCase instance
-        """
-        logger.info("Creating simple orchestrator (TaskCoordinatorUseCase)")
+    Args:
+        llm_provider: LLM provider (used for Phase 1 fallback)
+        task_planner: Task planning strategy (simple-mode fallback)
+        agent_executor: Agent execution strategy (simple-mode fallback)
+        agents: Available agents
+        logger_instance: Optional logger (simple-mode fallback)
 
-        return TaskCoordinatorUseCase(
+    Returns:
+        OpenAIAgentsSDKAdapter instance, or TaskCoordinatorUseCase fallback
+    """
+    if not OPENAI_AGENTS_AVAILABLE:
+        logger.warning(
+            "OpenAI Agents SDK not available, falling back to simple mode. "
+            "Install with: pip install openai-agents"
+        )
+        return _create_simple_orchestrator(
+            llm_provider=llm_provider,
             task_planner=task_planner,
             agent_executor=agent_executor,
-            max_retries=3,
-            logger=logger_instance
+            agents=agents,
+            logger_instance=logger_instance
         )
 
-    @staticmethod
-    def _create_openai_agents_orchestrator(
-        llm_provider: ITextGenerator,
-        agents: List[Agent]
-    ) -> IAgentCoordinator:
-        """
-        Create OpenAI Agents SDK orchestrator.
+    logger.info("Creating OpenAI Agents SDK orchestrator")
 
-        Args:
-            llm_provider: LLM provider (used for Phase 1 fallback)
-            agents: Available agents
+    return OpenAIAgentsSDKAdapter(
+        llm_provider=llm_provider,
+        agents=agents,
+        max_turns=10
+    )
 
-        Returns:
-            OpenAIAgentsSDKAdapter instance
-        """
-        logger.info("Creating OpenAI Agents SDK orchestrator")
 
-        return OpenAIAgentsSDKAdapter(
-            llm_provider=llm_provider,
-            agents=agents,
-            max_turns=10
-        )
+def _create_hybrid_orchestrator(
+    llm_provider: ITextGenerator,
+    task_planner: ITaskPlanner,
+    agent_executor: IAgentExecutor,
+    agents: List[Agent],
+    logger_instance: Optional[logging.Logger]
+) -> IAgentCoordinator:
+    """
+    Create hybrid orchestrator with intelligent routing.
 
-    @staticmethod
-    def _create_hybrid_orchestrator(
-        llm_provider: ITextGenerator,
-        task_planner: ITaskPlanner,
-        agent_executor: IAgentExecutor,
-        agents: List[Agent],
-        logger_instance: Optional[logging.Logger]
-    ) -> IAgentCoordinator:
-        """
-        Create hybrid orchestrator with intelligent routing.
+    Week 10, Phase 2: Routes tasks between SDK and simple mode.
 
-        Week 10, Phase 2: Routes tasks between SDK and simple mode.
+    When SDK mode is unavailable or disabled, "hybrid" degrades to the
+    simple orchestrator itself (no wrapper, no per-task routing overhead).
 
-        Args:
-            llm_provider: LLM provider
-            task_planner: Task planning strategy
-            agent_executor: Agent execution strategy
-            agents: Available agents
-            logger_instance: Optional logger
+    Args:
+        llm_provider: LLM provider
+        task_planner: Task planning strategy
+        agent_executor: Agent execution strategy
+        agents: Available agents
+        logger_instance: Optional logger
 
-        Returns:
-            HybridOrchestrator instance
-        """
-        logger.info("Creating hybrid orchestrator (intelligent routing)")
-
-        from src.adapters.orchestration.hybrid_orchestrator import HybridOrchestrator
-
-        # Check if SDK is available for hybrid mode
-        # Allow runtime override via environment variable (for llama-cpp-server dependency issues)
-        disable_sdk_env = os.getenv("DISABLE_SDK_MODE", "").lower() in ("true", "1", "yes")
-        enable_sdk = OPENAI_AGENTS_AVAILABLE and not disable_sdk_env
-
-        if not enable_sdk:
-            if disable_sdk_env:
-                logger.info(
-                    "SDK mode explicitly disabled via DISABLE_SDK_MODE environment variable. "
-                    "Hybrid mode will use simple orchestrator only."
-                )
-            else:
-                logger.warning(
-                    "SDK not available, hybrid mode will use simple mode only. "
-                    "Install with: pip install openai-agents"
-                )
-
-        return HybridOrchestrator(
+    Returns:
+        HybridOrchestrator instance, or TaskCoordinatorUseCase without SDK
+    """
+    # Check if SDK is available for hybrid mode
+    # Allow runtime override via environment variable (for llama-cpp-server dependency issues)
+    disable_sdk_env = os.getenv("DISABLE_SDK_MODE", "").lower() in ("true", "1", "yes")
+    enable_sdk = OPENAI_AGENTS_AVAILABLE and not disable_sdk_env
+
+    if not enable_sdk:
+        if disable_sdk_env:
+            logger.info(
+                "SDK mode explicitly disabled via DISABLE_SDK_MODE environment variable. "
+                "Hybrid mode will use simple orchestrator only."
+            )
+        else:
+            logger.warning(
+                "SDK not available, hybrid mode will use simple mode only. "
+                "Install with: pip install openai-agents"
+            )
+
+        return _create_simple_orchestrator(
             llm_provider=llm_provider,
             task_planner=task_planner,
             agent_executor=agent_executor,
             agents=agents,
-            logger_instance=logger_instance,
-            enable_sdk=enable_sdk
+            logger_instance=logger_instance
         )
 
-    @staticmethod
-    def get_supported_modes() -> List[str]:
-        """
-        Get list of supported orchestration modes.
+    logger.info("Creating hybrid orchestrator (intelligent routing)")
 
-        Returns:
-            List of mode names
-        """
-        modes = ["simple", "hybrid"]  # hybrid always available
+    from src.adapters.orchestration.hybrid_orchestrator import HybridOrchestrator
 
-        if OPENAI_AGENTS_AVAILABLE:
-            modes.append("openai-agents")
+    return HybridOrchestrator(
+        llm_provider=llm_provider,
+        task_planner=task_planner,
+        agent_executor=agent_executor,
+        agents=agents,
+        logger_instance=logger_instance,
+        enable_sdk=True
+    )
 
-        return modes
 
-    @staticmethod
-    def is_mode_available(mode: str) -> bool:
-        """
-        Check if orchestration mode is available.
+# OCP: Register new modes by adding a builder here (shared keyword signature)
+_ORCHESTRATOR_BUILDERS: Dict[OrchestrationMode, Callable[..., IAgentCoordinator]] = {
+    OrchestrationMode.SIMPLE: _create_simple_orchestrator,
+    OrchestrationMode.OPENAI_AGENTS: _create_openai_agents_orchestrator,
+    OrchestrationMode.HYBRID: _create_hybrid_orchestrator,
+}
 
-        Args:
-            mode: Mode name
 
-        Returns:
-            True if mode is available
-        """
-        mode = mode.lower()
-
-        if mode == "simple":
-            return True
-        elif mode == "hybrid":
-            return True  # Always available (falls back to simple if SDK unavailable)
-        elif mode == "openai-agents":
-            return OPENAI_AGENTS_AVAILABLE
-        else:
-            return False
\ No newline at end of file
+def get_supported_modes() -> List[str]:
+    """
+    Get list of supported orchestration modes.
+
+    Returns:
+        List of mode names
+    """
+    modes = ["simple", "hybrid"]  # hybrid always available
+
+    if OPENAI_AGENTS_AVAILABLE:
+        modes.append("openai-agents")
+
+    return modes
+
+
+def is_mode_available(mode: Union[str, OrchestrationMode]) -> bool:
+    """
+    Check if orchestration mode is available.
+
+    Args:
+        mode: Mode name
+
+    Returns:
+        True if mode is available
+    """
+    try:
+        mode = OrchestrationMode.parse(mode)
+    except ValueError:
+        return False
+
+    if mode is OrchestrationMode.OPENAI_AGENTS:
+        return OPENAI_AGENTS_AVAILABLE
+    return True  # simple, and hybrid (falls back to simple if SDK unavailable)
+
+
+class OrchestrationFactory:
+    """
+    Factory for creating orchestrators.
+
+    Clean Architecture: Factory pattern for dependency creation.
+    DIP: Returns IAgentCoordinator interface (callers depend on abstraction).
+
+    Supported modes:
+    - "simple": TaskCoordinatorUseCase (current, default)
+    - "openai-agents": OpenAIAgentsSDKAdapter (Week 7, Phase 1)
+    - "hybrid": HybridOrchestrator (Week 10, Phase 2 - intelligent routing)
+
+    Stateless namespace kept for backward compatibility; new code can import
+    the module-level functions (e.g., create_orchestrator) directly.
+    """
+
+    create_orchestrator = staticmethod(create_orchestrator)
+    get_supported_modes = staticmethod(get_supported_modes)
+    is_mode_available = staticmethod(is_mode_available)
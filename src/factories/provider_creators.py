@@ -2,65 +2,227 @@
 Provider Creators - Strategy Pattern for provider instantiation.
 
 Clean Architecture: Separates provider creation logic from factory.
-DIP: ProviderFactory depends on IProviderCreator abstraction.
+DIP: ProviderFactory depends on the create(config) callable abstraction.
 OCP: Add new providers without modifying ProviderFactory.
 SRP: Each creator has single responsibility.
 
 Week 13: Extracted from ProviderFactory to fix DIP violation.
 """
 
+import functools
+import importlib
 import os
-from typing import Optional, Dict, Any, Protocol
-from src.interfaces import ITextGenerator
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional, Dict, Any, Protocol, Tuple
+
+if TYPE_CHECKING:
+    from src.interfaces import ITextGenerator
+    from src.routing.model_selector import SelectionCriteria
+
+
+# Registry entry: a creator's bound create() method
+CreateProviderFn = Callable[[Optional[Dict[str, Any]]], "ITextGenerator"]
+
+
+def _xai_key_present() -> bool:
+    """Check XAI_API_KEY (read live: .env may be loaded after import)."""
+    return bool(os.environ.get("XAI_API_KEY"))
+
+
+# Lightweight provider index: module paths are strings, so listing providers
+# imports nothing; the adapter module loads on first create (two-phase discovery)
+PROVIDER_METADATA: Dict[str, Dict[str, str]] = {
+    "mock": {
+        "module": "src.adapters.llm.mock_provider",
+        "class": "MockLLMProvider",
+        "description": "Mock LLM provider (testing)",
+    },
+    "grok": {
+        "module": "src.adapters.llm.grok_adapter",
+        "class": "GrokAdapter",
+        "description": "Grok-Code-Fast-1 via X.AI API (requires XAI_API_KEY)",
+    },
+    "tongyi": {
+        "module": "src.adapters.llm.tongyi_adapter",
+        "class": "TongyiDeepResearchAdapter",
+        "description": "Tongyi-DeepResearch-30B via llama.cpp (sync, legacy)",
+    },
+    "tongyi-local": {
+        "module": "src.adapters.llm.tongyi_local_adapter",
+        "class": "LocalTongyiAdapter",
+        "description": "Local Tongyi via llama.cpp server (async)",
+    },
+    "replicate": {
+        "module": "src.adapters.llm.replicate_adapter",
+        "class": "ReplicateAdapter",
+        "description": "Replicate cloud GPU inference",
+    },
+    "qwen3_zerogpu": {
+        "module": "src.adapters.llm.qwen3_zerogpu_adapter",
+        "class": "Qwen3InferenceAdapter",
+        "description": "Qwen3-8B via HuggingFace ZeroGPU Space",
+    },
+    "auto": {
+        "module": "src.adapters.llm.model_orchestrator",
+        "class": "ModelOrchestrator",
+        "description": "Intelligent multi-model selection with fallback",
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_adapter_class(provider_name: str) -> type:
+    """
+    Import and memoize the adapter class for a provider.
+
+    Lazy: Adapter modules (and their HTTP/SDK dependencies) load on first
+    create, and later creates skip the import machinery entirely.
+    """
+    metadata = PROVIDER_METADATA[provider_name]
+    return getattr(importlib.import_module(metadata["module"]), metadata["class"])
 
 
-class IProviderCreator(Protocol):
+@functools.lru_cache(maxsize=None)
+def _criteria_map() -> Dict[str, "SelectionCriteria"]:
     """
-    Interface for provider creators.
+    Map criteria names ("speed", "balanced", ...) to SelectionCriteria.
 
-    DIP: ProviderFactory depends on this abstraction, not concrete creators.
-    Strategy Pattern: Each creator encapsulates provider instantiation logic.
+    Built once on first use; the routing package is imported lazily so
+    loading this module stays cheap.
     """
+    from src.routing.model_selector import SelectionCriteria
+    return {criteria.value: criteria for criteria in SelectionCriteria}
 
-    def create(self, config: Optional[Dict[str, Any]] = None) -> ITextGenerator:
-        """
-        Create provider instance.
 
-        Args:
-            config: Provider configuration
+# Cheap availability probes per provider; providers without one are assumed available
+_AVAILABILITY_PROBES: Dict[str, Callable[[], bool]] = {
+    "grok": _xai_key_present,
+}
+
+# Stale-while-revalidate cache: provider name -> (available, checked_at)
+_AVAILABILITY_TTL = 60.0
+_availability_cache: Dict[str, Tuple[bool, float]] = {}
+_availability_lock = threading.Lock()
+
+
+def _probe_availability(provider_name: str) -> bool:
+    """Run a provider's availability probe and record the result."""
+    try:
+        available = bool(_AVAILABILITY_PROBES[provider_name]())
+    except Exception:
+        available = False
+
+    with _availability_lock:
+        _availability_cache[provider_name] = (available, time.monotonic())
+    return available
+
+
+def is_provider_available(provider_name: str, ttl: float = _AVAILABILITY_TTL) -> bool:
+    """
+    Check provider availability using stale-while-revalidate caching.
+
+    The first check probes synchronously. Afterwards the cached value is
+    served; once older than ttl it is still served while a background
+    thread re-probes, so callers never wait on a refresh.
+
+    Args:
+        provider_name: Provider name (e.g., "grok")
+        ttl: Seconds before a cached result is revalidated
+
+    Returns:
+        True if the provider is (last known to be) available
+    """
+    if provider_name not in _AVAILABILITY_PROBES:
+        return True
+
+    entry = _availability_cache.get(provider_name)
+    if entry is None:
+        return _probe_availability(provider_name)
 
-        Returns:
-            ITextGenerator implementation
+    available, checked_at = entry
+    if time.monotonic() - checked_at > ttl:
+        with _availability_lock:
+            # Re-stamp so concurrent callers don't start duplicate refreshes
+            _availability_cache[provider_name] = (available, time.monotonic())
+        threading.Thread(
+            target=_probe_availability, args=(provider_name,), daemon=True
+        ).start()
 
-        Raises:
-            ValueError: If creation fails (e.g., missing API keys)
+    return available
+
+
+def reset_env_cache() -> None:
+    """Forget cached availability checks (for tests that edit os.environ)."""
+    with _availability_lock:
+        _availability_cache.clear()
+
+
+if TYPE_CHECKING:
+    class IProviderCreator(Protocol):
         """
-        ...
+        Interface for provider creators.
+
+        DIP: ProviderFactory depends on this abstraction, not concrete creators.
+        Strategy Pattern: Each creator encapsulates provider instantiation logic.
+        """
+
+        def create(self, config: Optional[Dict[str, Any]] = None) -> "ITextGenerator":
+            """
+            Create provider instance.
+
+            Args:
+                config: Provider configuration
+
+            Returns:
+                ITextGenerator implementation
+
+            Raises:
+                ValueError: If creation fails (e.g., missing API keys)
+            """
+            ...
+
+
+class LegacyProviderCreator:
+    """
+    Creator shim wrapping a provider class (legacy register_provider API).
+
+    Instantiates the class with config passed as keyword arguments.
+    """
+
+    __slots__ = ("provider_class",)
+
+    def __init__(self, provider_class):
+        self.provider_class = provider_class
+
+    def create(self, config: Optional[Dict[str, Any]] = None) -> "ITextGenerator":
+        return self.provider_class(**(config or {}))
 
 
 class MockProviderCreator:
     """Creator for mock LLM provider (testing)."""
 
-    def create(self, config: Optional[Dict[str, Any]] = None) -> ITextGenerator:
-        from src.adapters.llm.mock_provider import MockLLMProvider
+    __slots__ = ()
 
-        default_response = "Mock response"
-        if config and "response" in config:
-            default_response = config["response"]
+    def create(self, config: Optional[Dict[str, Any]] = None) -> "ITextGenerator":
+        MockLLMProvider = _load_adapter_class("mock")
+        config = config or {}
 
-        return MockLLMProvider(default_response=default_response)
+        return MockLLMProvider(default_response=config.get("response", "Mock response"))
 
 
 class GrokProviderCreator:
     """Creator for Grok-Code-Fast-1 provider (X.AI API)."""
 
-    def create(self, config: Optional[Dict[str, Any]] = None) -> ITextGenerator:
-        if not os.getenv("XAI_API_KEY"):
+    __slots__ = ()
+
+    def create(self, config: Optional[Dict[str, Any]] = None) -> "ITextGenerator":
+        if not _xai_key_present():
             raise ValueError(
                 "XAI_API_KEY not set. Get key from: https://x.ai/api"
             )
 
-        from src.adapters.llm.grok_adapter import GrokAdapter
+        GrokAdapter = _load_adapter_class("grok")
         return GrokAdapter()
 
 
@@ -71,14 +233,15 @@ class TongyiProviderCreator:
     Legacy provider using sync requests. Prefer TongyiLocalProviderCreator.
     """
 
-    def create(self, config: Optional[Dict[str, Any]] = None) -> ITextGenerator:
-        from src.adapters.llm.tongyi_adapter import TongyiDeepResearchAdapter
+    __slots__ = ()
 
-        server_url = "http://localhost:8080"
-        if config and "server_url" in config:
-            server_url = config["server_url"]
+    def create(self, config: Optional[Dict[str, Any]] = None) -> "ITextGenerator":
+        TongyiDeepResearchAdapter = _load_adapter_class("tongyi")
+        config = config or {}
 
-        return TongyiDeepResearchAdapter(server_url=server_url)
+        return TongyiDeepResearchAdapter(
+            server_url=config.get("server_url", "http://localhost:8080")
+        )
 
 
 class TongyiLocalProviderCreator:
@@ -89,19 +252,16 @@ class TongyiLocalProviderCreator:
     Default: http://localhost:8080 (llama-cpp-server Docker container)
     """
 
-    def create(self, config: Optional[Dict[str, Any]] = None) -> ITextGenerator:
-        from src.adapters.llm.tongyi_local_adapter import LocalTongyiAdapter
-
-        base_url = "http://localhost:8080"
-        timeout = 120
+    __slots__ = ()
 
-        if config:
-            if "base_url" in config:
-                base_url = config["base_url"]
-            if "timeout" in config:
-                timeout = config["timeout"]
+    def create(self, config: Optional[Dict[str, Any]] = None) -> "ITextGenerator":
+        LocalTongyiAdapter = _load_adapter_class("tongyi-local")
+        config = config or {}
 
-        return LocalTongyiAdapter(base_url=base_url, timeout=timeout)
+        return LocalTongyiAdapter(
+            base_url=config.get("base_url", "http://localhost:8080"),
+            timeout=config.get("timeout", 120)
+        )
 
 
 class ReplicateProviderCreator:
@@ -111,14 +271,13 @@ class ReplicateProviderCreator:
     Week 9: Parallel data collection with cloud GPU.
     """
 
-    def create(self, config: Optional[Dict[str, Any]] = None) -> ITextGenerator:
-        from src.adapters.llm.replicate_adapter import ReplicateAdapter
+    __slots__ = ()
 
-        model = "meta/llama-2-70b-chat"
-        if config and "model" in config:
-            model = config["model"]
+    def create(self, config: Optional[Dict[str, Any]] = None) -> "ITextGenerator":
+        ReplicateAdapter = _load_adapter_class("replicate")
+        config = config or {}
 
-        return ReplicateAdapter(model=model)
+        return ReplicateAdapter(model=config.get("model", "meta/llama-2-70b-chat"))
 
 
 class Qwen3ProviderCreator:
@@ -129,19 +288,16 @@ class Qwen3ProviderCreator:
     Performance: 100% success rate, 13.8s avg latency, FREE with HF Pro.
     """
 
-    def create(self, config: Optional[Dict[str, Any]] = None) -> ITextGenerator:
-        from src.adapters.llm.qwen3_zerogpu_adapter import Qwen3InferenceAdapter
-
-        space_id = "hollis-source/qwen3-inference"
-        timeout = 60
+    __slots__ = ()
 
-        if config:
-            if "space_id" in config:
-                space_id = config["space_id"]
-            if "timeout" in config:
-                timeout = config["timeout"]
+    def create(self, config: Optional[Dict[str, Any]] = None) -> "ITextGenerator":
+        Qwen3InferenceAdapter = _load_adapter_class("qwen3_zerogpu")
+        config = config or {}
 
-        return Qwen3InferenceAdapter(space_id=space_id, timeout=timeout)
+        return Qwen3InferenceAdapter(
+            space_id=config.get("space_id", "hollis-source/qwen3-inference"),
+            timeout=config.get("timeout", 60)
+        )
 
 
 class OrchestratorProviderCreator:
@@ -162,57 +318,49 @@ class OrchestratorProviderCreator:
         max_fallback_attempts: Maximum fallback attempts (default: 3)
     """
 
-    def __init__(self, provider_factory):
+    __slots__ = ("provider_factory",)
+
+    def __init__(self, provider_factory=None):
         """
         Initialize orchestrator creator.
 
         Args:
             provider_factory: Factory for creating fallback providers
+                (default: process-wide factory, resolved on first create)
 
         Note: Circular dependency handled via lazy import.
         """
         self.provider_factory = provider_factory
 
-    def create(self, config: Optional[Dict[str, Any]] = None) -> ITextGenerator:
-        from src.adapters.llm.model_orchestrator import ModelOrchestrator
-        from src.routing.model_selector import SelectionCriteria
+    def create(self, config: Optional[Dict[str, Any]] = None) -> "ITextGenerator":
+        ModelOrchestrator = _load_adapter_class("auto")
+        config = config or {}
 
         # Parse criteria
-        criteria_str = "balanced"
-        if config and "criteria" in config:
-            criteria_str = config["criteria"]
-
-        criteria_map = {
-            "speed": SelectionCriteria.SPEED,
-            "quality": SelectionCriteria.QUALITY,
-            "cost": SelectionCriteria.COST,
-            "privacy": SelectionCriteria.PRIVACY,
-            "balanced": SelectionCriteria.BALANCED
-        }
-        criteria = criteria_map.get(criteria_str.lower(), SelectionCriteria.BALANCED)
-
-        # Get available providers
-        available_providers = None
-        if config and "available_providers" in config:
-            available_providers = config["available_providers"]
+        criteria_str = config.get("criteria", "balanced")
+        criteria_map = _criteria_map()
+        # Fast path: criteria names are usually already lowercase
+        criteria = criteria_map.get(criteria_str) or criteria_map.get(
+            criteria_str.lower(), criteria_map["balanced"]
+        )
 
+        # Get available providers, dropping ones known to be unavailable
+        available_providers = config.get("available_providers")
         if available_providers is None:
             available_providers = ["qwen3_zerogpu", "tongyi-local", "grok"]
 
-        # Get fallback settings
-        enable_fallback = True
-        max_fallback_attempts = 3
+        usable_providers = [name for name in available_providers if is_provider_available(name)]
+        if usable_providers:
+            available_providers = usable_providers
 
-        if config:
-            if "enable_fallback" in config:
-                enable_fallback = config["enable_fallback"]
-            if "max_fallback_attempts" in config:
-                max_fallback_attempts = config["max_fallback_attempts"]
+        if self.provider_factory is None:
+            from src.factories.provider_factory import get_default_factory
+            self.provider_factory = get_default_factory()
 
         return ModelOrchestrator(
             provider_factory=self.provider_factory,
             criteria=criteria,
             available_providers=available_providers,
-            enable_fallback=enable_fallback,
-            max_fallback_attempts=max_fallback_attempts
+            enable_fallback=config.get("enable_fallback", True),
+            max_fallback_attempts=config.get("max_fallback_attempts", 3)
         )
@@ -5,10 +5,15 @@ Clean Architecture: DIP, OCP compliance via creator registry.
 Week 13: Refactored to fix DIP violation (no direct adapter imports).
 """
 
-from typing import Optional, Dict, Any
+import functools
+import inspect
+import sys
+from typing import TYPE_CHECKING, Optional, Dict, Any, Hashable, Tuple
 from src.interfaces import ITextGenerator, IProviderFactory
 from src.factories.provider_creators import (
-    IProviderCreator,
+    PROVIDER_METADATA,
+    CreateProviderFn,
+    LegacyProviderCreator,
     MockProviderCreator,
     GrokProviderCreator,
     TongyiProviderCreator,
@@ -18,6 +23,31 @@ from src.factories.provider_creators import (
     OrchestratorProviderCreator
 )
 
+if TYPE_CHECKING:
+    from src.factories.provider_creators import IProviderCreator
+
+__all__ = ["ProviderFactory", "get_default_factory"]
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a config value into a hashable, order-independent form.
+
+    Dicts become frozensets of (key, frozen value) pairs; lists, tuples
+    and sets become tuples/frozensets of frozen items.
+
+    Raises:
+        TypeError: If a leaf value is not hashable
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    hash(value)
+    return value
+
 
 class ProviderFactory(IProviderFactory):
     """
@@ -29,15 +59,47 @@ class ProviderFactory(IProviderFactory):
     - SRP: Single responsibility - coordinate creator registry
 
     Week 13: Refactored to eliminate direct adapter imports.
+
+    Object Pool (opt-in): With cache_instances=True, created providers are
+    cached per (provider_type, config), so stateful adapters (aiohttp
+    sessions, HF Space clients) reuse their connection pools instead of
+    rebuilding them on every call. Pooled providers may be bound to the
+    event loop they first ran on: scope a pooling factory to one loop and
+    await close_all() before that loop closes.
     """
 
-    def __init__(self):
+    __slots__ = ("_creators", "_frozen", "_cache_instances", "_instance_cache")
+
+    # Stateless built-in creators, built once at import and shared by all factories
+    _DEFAULT_CREATORS: Dict[str, CreateProviderFn] = {
+        sys.intern(name): creator.create
+        for name, creator in (
+            ("mock", MockProviderCreator()),
+            ("grok", GrokProviderCreator()),
+            ("tongyi", TongyiProviderCreator()),
+            ("tongyi-local", TongyiLocalProviderCreator()),
+            ("replicate", ReplicateProviderCreator()),
+            ("qwen3_zerogpu", Qwen3ProviderCreator()),
+        )
+    }
+
+    def __init__(self, cache_instances: bool = False):
         """
         Initialize provider factory with creator registry.
 
         Registers default creators for all supported providers.
+
+        Args:
+            cache_instances: Reuse providers created with the same type and
+                config (default: False, a fresh instance on every
+                create_provider() call). The owner of a pooling factory must
+                await close_all() before the event loop it used closes.
         """
-        self._creators: Dict[str, IProviderCreator] = {}
+        # Registry stores bound create() methods: one call per dispatch
+        self._creators: Dict[str, CreateProviderFn] = {}
+        self._frozen = False
+        self._cache_instances = cache_instances
+        self._instance_cache: Dict[Tuple[str, Hashable], ITextGenerator] = {}
 
         # Register default creators
         self._register_default_creators()
@@ -48,20 +110,15 @@ class ProviderFactory(IProviderFactory):
 
         Internal method to set up built-in providers.
         """
-        self._creators["mock"] = MockProviderCreator()
-        self._creators["grok"] = GrokProviderCreator()
-        self._creators["tongyi"] = TongyiProviderCreator()
-        self._creators["tongyi-local"] = TongyiLocalProviderCreator()
-        self._creators["replicate"] = ReplicateProviderCreator()
-        self._creators["qwen3_zerogpu"] = Qwen3ProviderCreator()
+        self._creators.update(self._DEFAULT_CREATORS)
 
         # Orchestrator needs factory reference (circular dependency handled via lazy import)
-        self._creators["auto"] = OrchestratorProviderCreator(provider_factory=self)
+        self.register_creator("auto", OrchestratorProviderCreator(provider_factory=self))
 
     def register_creator(
         self,
         name: str,
-        creator: IProviderCreator
+        creator: "IProviderCreator"
     ) -> None:
         """
         Register custom provider creator.
@@ -75,7 +132,10 @@ class ProviderFactory(IProviderFactory):
         Example:
             factory.register_creator("my-model", MyModelCreator())
         """
-        self._creators[name] = creator
+        self._check_not_frozen(name)
+        name = sys.intern(name)
+        self._creators[name] = creator.create
+        self.invalidate(name)
 
     def register_provider(self, name: str, provider_class: Any) -> None:
         """
@@ -83,15 +143,44 @@ class ProviderFactory(IProviderFactory):
 
         Deprecated: Use register_creator() instead for better DIP compliance.
         """
-        # Wrap provider class in lambda creator for backward compatibility
-        class LegacyCreator:
-            def __init__(self, provider_class):
-                self.provider_class = provider_class
+        # Wrap provider class in creator shim for backward compatibility
+        self._check_not_frozen(name)
+        name = sys.intern(name)
+        self._creators[name] = LegacyProviderCreator(provider_class).create
+        self.invalidate(name)
+
+    def freeze(self) -> None:
+        """
+        Make the creator registry read-only.
 
-            def create(self, config: Optional[Dict[str, Any]] = None) -> ITextGenerator:
-                return self.provider_class(**(config or {}))
+        Call once startup registration is done; later register_* calls
+        raise RuntimeError. Idempotent.
+        """
+        self._frozen = True
 
-        self._creators[name] = LegacyCreator(provider_class)
+    @property
+    def frozen(self) -> bool:
+        """Whether freeze() has been called."""
+        return self._frozen
+
+    def _check_not_frozen(self, name: str) -> None:
+        """Raise if the registry was frozen (registration after startup)."""
+        if self.frozen:
+            raise RuntimeError(
+                f"Cannot register provider '{name}': ProviderFactory is frozen"
+            )
+
+    def list_providers(self) -> Dict[str, Dict[str, str]]:
+        """
+        List registered providers with lightweight metadata.
+
+        Imports no adapter modules; custom providers without metadata map
+        to an empty dict.
+
+        Returns:
+            Provider name -> metadata (module, class, description)
+        """
+        return {name: dict(PROVIDER_METADATA.get(name, {})) for name in sorted(self._creators)}
 
     def create_provider(
         self,
@@ -116,12 +205,76 @@ class ProviderFactory(IProviderFactory):
         Example:
             provider = factory.create_provider("qwen3_zerogpu", {"timeout": 120})
         """
-        if provider_type not in self._creators:
+        provider_type = sys.intern(provider_type)
+        create = self._creators.get(provider_type)
+        if create is None:
             available = ", ".join(sorted(self._creators.keys()))
             raise ValueError(
                 f"Unknown provider type: {provider_type}. "
                 f"Available providers: {available}"
             )
 
-        creator = self._creators[provider_type]
-        return creator.create(config)
\ No newline at end of file
+        if not self._cache_instances:
+            return create(config)
+
+        try:
+            cache_key = (provider_type, _freeze(config or {}))
+        except TypeError:
+            # Unhashable config values: skip pooling rather than fail
+            return create(config)
+
+        provider = self._instance_cache.get(cache_key)
+        if provider is None:
+            provider = create(config)
+            self._instance_cache[cache_key] = provider
+        return provider
+
+    def invalidate(self, provider_type: Optional[str] = None) -> None:
+        """
+        Drop cached provider instances without closing them.
+
+        Args:
+            provider_type: Provider to invalidate (default: all providers)
+        """
+        if provider_type is None:
+            self._instance_cache.clear()
+            return
+
+        for key in [key for key in self._instance_cache if key[0] == provider_type]:
+            del self._instance_cache[key]
+
+    async def close_all(self) -> None:
+        """
+        Close all cached provider instances and empty the cache.
+
+        Awaits aclose()/close() on providers that expose one (e.g.,
+        LocalTongyiAdapter's aiohttp session). Call during teardown.
+        """
+        providers = list(self._instance_cache.values())
+        self._instance_cache.clear()
+
+        for provider in providers:
+            close = getattr(provider, "aclose", None) or getattr(provider, "close", None)
+            if close is None:
+                continue
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+
+@functools.cache
+def get_default_factory() -> ProviderFactory:
+    """
+    Get the process-wide ProviderFactory.
+
+    Singleton: The creator registry is built once and shared by all
+    callers. It does not pool instances, since it outlives any one event
+    loop; code that wants pooling creates its own
+    ProviderFactory(cache_instances=True) per loop and closes it (see
+    main()). ProviderFactory() also gives a fresh, isolated registry
+    (e.g., tests).
+
+    Returns:
+        Shared ProviderFactory instance
+    """
+    return ProviderFactory()
@@ -6,7 +6,9 @@ Week 12: Team-based architecture factory.
 Clean Architecture: Factory pattern for team creation.
 """
 
-from typing import List
+from functools import partial
+from itertools import chain
+from typing import Callable, Dict, List, Optional, Tuple, Type
 from src.entities import (
     Agent,
     AgentTeam,
@@ -23,6 +25,58 @@ from src.entities import (
 from src.factories.agent_factory import AgentFactory
 
 
+# Team blueprint: (prebound team builder, lead role, specialist roles)
+TeamSpec = Tuple[Callable[..., AgentTeam], str, Tuple[str, ...]]
+
+
+def _team(
+    team_class: Type[AgentTeam], name: str, domain: str, tier: int
+) -> Callable[..., AgentTeam]:
+    """Prebind a team class's fixed kwargs; the builder only needs agents and lead."""
+    return partial(team_class, name=name, domain=domain, tier=tier)
+
+
+# Week 12/13: 9 teams from the 16-agent scaled system
+_SCALED_TEAM_SPECS: Tuple[TeamSpec, ...] = (
+    (_team(OrchestrationTeam, "Orchestration", "general", 1), "master-orchestrator", ()),
+    (_team(QualityAssuranceTeam, "Quality Assurance", "quality", 1), "qa-lead", ()),
+    (_team(FrontendTeam, "Frontend", "frontend", 2), "frontend-lead",
+     ("javascript-typescript-specialist",)),
+    (_team(BackendTeam, "Backend", "backend", 2), "backend-lead", ("python-specialist",)),
+    (_team(TestingTeam, "Testing", "testing", 2), "testing-lead",
+     ("unit-test-engineer", "integration-test-engineer")),
+    (_team(InfrastructureTeam, "Infrastructure", "devops", 2), "devops-lead", ()),
+    (_team(ResearchTeam, "Research", "research", 2), "research-lead", ("technical-writer",)),
+    # Week 13: DSL & mathematical foundations
+    (_team(CategoryTheoryTeam, "Category Theory", "category-theory", 2), "category-theory-expert",
+     ("dsl-architect",)),
+    # Week 13: DSL deployment & task engineering
+    (_team(DSLTeam, "DSL", "dsl", 2), "dsl-deployment-specialist", ("dsl-task-engineer",)),
+)
+
+# Week 12: 7 teams from the 8-agent extended system (Phase 1 compatibility)
+_EXTENDED_TEAM_SPECS: Tuple[TeamSpec, ...] = (
+    (_team(OrchestrationTeam, "Orchestration", "general", 1), "master-orchestrator", ()),
+    (_team(QualityAssuranceTeam, "Quality Assurance", "quality", 1), "qa-lead", ()),
+    # Frontend: just lead, no specialist yet in Phase 1
+    (_team(FrontendTeam, "Frontend", "frontend", 2), "frontend-lead", ()),
+    (_team(BackendTeam, "Backend", "backend", 2), "backend-lead", ("python-specialist",)),
+    (_team(InfrastructureTeam, "Infrastructure", "devops", 2), "devops-lead", ()),
+    # Phase 1 had no testing-lead or research-lead: ad-hoc self-led teams
+    (_team(TestingTeam, "Testing", "testing", 3), "unit-test-engineer", ()),
+    (_team(ResearchTeam, "Research", "research", 3), "technical-writer", ()),
+)
+
+# Week 12: Domain for each single-agent team in default (5-agent) mode
+_DEFAULT_ROLE_DOMAIN: Dict[str, str] = {
+    "coder": "backend",
+    "tester": "testing",
+    "reviewer": "quality",
+    "coordinator": "general",
+    "researcher": "research",
+}
+
+
 class TeamFactory:
     """
     Factory for creating agent teams.
@@ -40,14 +94,30 @@ class TeamFactory:
     - Maintains backward compatibility
     """
 
-    def __init__(self, agent_factory: AgentFactory = None):
+    __slots__ = ("_agent_factory", "_teams_cache")
+
+    def __init__(self, agent_factory: Optional[AgentFactory] = None):
         """
         Initialize team factory.
 
         Args:
             agent_factory: Optional agent factory (creates default if not provided)
         """
-        self.agent_factory = agent_factory or AgentFactory()
+        self._agent_factory = agent_factory
+
+        # Memoized team lists per agent mode (output is deterministic)
+        self._teams_cache: Dict[str, List[AgentTeam]] = {}
+
+    @property
+    def agent_factory(self) -> AgentFactory:
+        """Agent factory, created on first use if none was provided."""
+        if self._agent_factory is None:
+            self._agent_factory = AgentFactory()
+        return self._agent_factory
+
+    def invalidate_cache(self) -> None:
+        """Drop memoized teams (e.g., after changing the agent factory)."""
+        self._teams_cache.clear()
 
     def create_scaled_teams(self) -> List[AgentTeam]:
         """
@@ -72,145 +142,13 @@ class TeamFactory:
         Returns:
             List of 9 agent teams
         """
-        # Get all 16 agents (Week 13: includes Category Theory & DSL specialists)
-        agents = self.agent_factory.create_scaled_agents()
-        agent_map = {agent.role: agent for agent in agents}
-
-        teams = []
-
-        # Team 1: Orchestration (Tier 1)
-        orchestrator = agent_map.get("master-orchestrator")
-        if orchestrator:
-            teams.append(OrchestrationTeam(
-                name="Orchestration",
-                domain="general",
-                agents=[orchestrator],
-                lead_agent=orchestrator,
-                tier=1
-            ))
-
-        # Team 2: Quality Assurance (Tier 1)
-        qa_lead = agent_map.get("qa-lead")
-        if qa_lead:
-            teams.append(QualityAssuranceTeam(
-                name="Quality Assurance",
-                domain="quality",
-                agents=[qa_lead],
-                lead_agent=qa_lead,
-                tier=1
-            ))
+        teams = self._teams_cache.get("scaled")
+        if teams is None:
+            # Get all 16 agents (Week 13: includes Category Theory & DSL specialists)
+            agents = self.agent_factory.create_scaled_agents()
+            teams = self._teams_cache["scaled"] = self._build_teams(agents, _SCALED_TEAM_SPECS)
 
-        # Team 3: Frontend (Tier 2 lead + Tier 3 specialist)
-        frontend_lead = agent_map.get("frontend-lead")
-        js_specialist = agent_map.get("javascript-typescript-specialist")
-        if frontend_lead:
-            frontend_agents = [frontend_lead]
-            if js_specialist:
-                frontend_agents.append(js_specialist)
-
-            teams.append(FrontendTeam(
-                name="Frontend",
-                domain="frontend",
-                agents=frontend_agents,
-                lead_agent=frontend_lead,
-                tier=2
-            ))
-
-        # Team 4: Backend (Tier 2 lead + Tier 3 specialist)
-        backend_lead = agent_map.get("backend-lead")
-        python_specialist = agent_map.get("python-specialist")
-        if backend_lead:
-            backend_agents = [backend_lead]
-            if python_specialist:
-                backend_agents.append(python_specialist)
-
-            teams.append(BackendTeam(
-                name="Backend",
-                domain="backend",
-                agents=backend_agents,
-                lead_agent=backend_lead,
-                tier=2
-            ))
-
-        # Team 5: Testing (Tier 2 lead + 2 Tier 3 specialists)
-        testing_lead = agent_map.get("testing-lead")
-        unit_engineer = agent_map.get("unit-test-engineer")
-        integration_engineer = agent_map.get("integration-test-engineer")
-        if testing_lead:
-            testing_agents = [testing_lead]
-            if unit_engineer:
-                testing_agents.append(unit_engineer)
-            if integration_engineer:
-                testing_agents.append(integration_engineer)
-
-            teams.append(TestingTeam(
-                name="Testing",
-                domain="testing",
-                agents=testing_agents,
-                lead_agent=testing_lead,
-                tier=2
-            ))
-
-        # Team 6: Infrastructure (Tier 2 DevOps)
-        devops_lead = agent_map.get("devops-lead")
-        if devops_lead:
-            teams.append(InfrastructureTeam(
-                name="Infrastructure",
-                domain="devops",
-                agents=[devops_lead],
-                lead_agent=devops_lead,
-                tier=2
-            ))
-
-        # Team 7: Research & Documentation (Tier 2 lead + Tier 3 specialist)
-        research_lead = agent_map.get("research-lead")
-        tech_writer = agent_map.get("technical-writer")
-        if research_lead:
-            research_agents = [research_lead]
-            if tech_writer:
-                research_agents.append(tech_writer)
-
-            teams.append(ResearchTeam(
-                name="Research",
-                domain="research",
-                agents=research_agents,
-                lead_agent=research_lead,
-                tier=2
-            ))
-
-        # Team 8: Category Theory (Week 13: DSL & mathematical foundations)
-        ct_expert = agent_map.get("category-theory-expert")
-        dsl_architect = agent_map.get("dsl-architect")
-        if ct_expert:
-            ct_agents = [ct_expert]
-            if dsl_architect:
-                ct_agents.append(dsl_architect)
-
-            teams.append(CategoryTheoryTeam(
-                name="Category Theory",
-                domain="category-theory",
-                agents=ct_agents,
-                lead_agent=ct_expert,
-                tier=2
-            ))
-
-        # Team 9: DSL Implementation (Week 13: DSL deployment & task engineering)
-        dsl_specialist = agent_map.get("dsl-deployment-specialist")
-        dsl_engineer = agent_map.get("dsl-task-engineer")
-        if dsl_specialist:
-            dsl_agents = [dsl_specialist]
-            if dsl_engineer:
-                dsl_agents.append(dsl_engineer)
-
-            teams.append(DSLTeam(
-                name="DSL",
-                domain="dsl",
-                agents=dsl_agents,
-                lead_agent=dsl_specialist,
-                tier=2
-            ))
-
-        return teams
+        return list(teams)
 
     def create_extended_teams(self) -> List[AgentTeam]:
         """
@@ -231,98 +169,13 @@ class TeamFactory:
         Returns:
             List of 6 agent teams
         """
-        # Get 8 agents from extended mode
-        agents = self.agent_factory.create_extended_agents()
-        agent_map = {agent.role: agent for agent in agents}
-
-        teams = []
+        teams = self._teams_cache.get("extended")
+        if teams is None:
+            # Get 8 agents from extended mode
+            agents = self.agent_factory.create_extended_agents()
+            teams = self._teams_cache["extended"] = self._build_teams(agents, _EXTENDED_TEAM_SPECS)
 
-        # Team 1: Orchestration
-        orchestrator = agent_map.get("master-orchestrator")
-        if orchestrator:
-            teams.append(OrchestrationTeam(
-                name="Orchestration",
-                domain="general",
-                agents=[orchestrator],
-                lead_agent=orchestrator,
-                tier=1
-            ))
-
-        # Team 2: Quality Assurance
-        qa_lead = agent_map.get("qa-lead")
-        if qa_lead:
-            teams.append(QualityAssuranceTeam(
-                name="Quality Assurance",
-                domain="quality",
-                agents=[qa_lead],
-                lead_agent=qa_lead,
-                tier=1
-            ))
-
-        # Team 3: Frontend (just lead, no specialist yet in Phase 1)
-        frontend_lead = agent_map.get("frontend-lead")
-        if frontend_lead:
-            teams.append(FrontendTeam(
-                name="Frontend",
-                domain="frontend",
-                agents=[frontend_lead],
-                lead_agent=frontend_lead,
-                tier=2
-            ))
-
-        # Team 4: Backend
-        backend_lead = agent_map.get("backend-lead")
-        python_specialist = agent_map.get("python-specialist")
-        if backend_lead:
-            backend_agents = [backend_lead]
-            if python_specialist:
-                backend_agents.append(python_specialist)
-
-            teams.append(BackendTeam(
-                name="Backend",
-                domain="backend",
-                agents=backend_agents,
-                lead_agent=backend_lead,
-                tier=2
-            ))
-
-        # Team 5: Infrastructure
-        devops_lead = agent_map.get("devops-lead")
-        if devops_lead:
-            teams.append(InfrastructureTeam(
-                name="Infrastructure",
-                domain="devops",
-                agents=[devops_lead],
-                lead_agent=devops_lead,
-                tier=2
-            ))
-
-        # Team 6: Research (In Phase 1, unit-test-engineer and technical-writer
-        # don't have proper leads, so we treat them as single-agent teams)
-        unit_engineer = agent_map.get("unit-test-engineer")
-        tech_writer = agent_map.get("technical-writer")
-
-        # Note: Phase 1 didn't have testing-lead or research-lead
-        # So we create ad-hoc teams for these agents
-        if unit_engineer:
-            teams.append(TestingTeam(
-                name="Testing",
-                domain="testing",
-                agents=[unit_engineer],
-                lead_agent=unit_engineer,  # Self-lead
-                tier=3
-            ))
-
-        if tech_writer:
-            teams.append(ResearchTeam(
-                name="Research",
-                domain="research",
-                agents=[tech_writer],
-                lead_agent=tech_writer,  # Self-lead
-                tier=3
-            ))
-
-        return teams
+        return list(teams)
 
     def create_default_teams(self) -> List[AgentTeam]:
         """
@@ -342,6 +195,10 @@ class TeamFactory:
         Returns:
             List of 5 single-agent teams
         """
+        cached = self._teams_cache.get("default")
+        if cached is not None:
+            return list(cached)
+
         # Get 5 default agents
         agents = self.agent_factory.create_default_agents()
 
@@ -349,14 +206,7 @@ class TeamFactory:
         teams = []
         for agent in agents:
             # Determine domain from agent role
-            domain_map = {
-                "coder": "backend",
-                "tester": "testing",
-                "reviewer": "quality",
-                "coordinator": "general",
-                "researcher": "research"
-            }
-            domain = domain_map.get(agent.role, "general")
+            domain = _DEFAULT_ROLE_DOMAIN.get(agent.role, "general")
 
             teams.append(AgentTeam(
                 name=agent.role.title(),
@@ -366,6 +216,41 @@ class TeamFactory:
                 tier=agent.tier
             ))
 
+        self._teams_cache["default"] = teams
+        return list(teams)
+
+    @staticmethod
+    def _build_teams(agents: List[Agent], specs: Tuple[TeamSpec, ...]) -> List[AgentTeam]:
+        """
+        Build teams from declarative team specs.
+
+        A team is created only if its lead role is present; missing
+        specialist roles are skipped.
+
+        Args:
+            agents: Available agents
+            specs: Team blueprints to instantiate, in order
+
+        Returns:
+            List of agent teams
+        """
+        # Comprehension measured faster than dict(zip(map(attrgetter("role"), ...)))
+        agent_map = {agent.role: agent for agent in agents}
+
+        teams = []
+        for build_team, lead_role, specialist_roles in specs:
+            lead = agent_map.get(lead_role)
+            if not lead:
+                continue
+
+            team_agents = [lead]
+            for role in specialist_roles:
+                specialist = agent_map.get(role)
+                if specialist:
+                    team_agents.append(specialist)
+
+            teams.append(build_team(agents=team_agents, lead_agent=lead))
+
         return teams
 
     def get_all_agents_from_teams(self, teams: List[AgentTeam]) -> List[Agent]:
@@ -380,10 +265,7 @@ class TeamFactory:
         Returns:
             Flat list of all agents across all teams
         """
-        agents = []
-        for team in teams:
-            agents.extend(team.agents)
-        return agents
+        return list(chain.from_iterable(team.agents for team in teams))
 
     def get_team_summary(self, teams: List[AgentTeam]) -> dict:
         """
@@ -395,18 +277,24 @@ class TeamFactory:
         Returns:
             Dictionary with team statistics
         """
-        total_agents = sum(len(team.agents) for team in teams)
-        teams_with_leads = sum(1 for team in teams if team.lead_agent)
-
+        team_count = 0
+        total_agents = 0
+        teams_with_leads = 0
         tier_distribution = {1: 0, 2: 0, 3: 0}
+
+        # Single pass over teams and their agents
         for team in teams:
+            team_count += 1
+            if team.lead_agent:
+                teams_with_leads += 1
             for agent in team.agents:
+                total_agents += 1
                 tier_distribution[agent.tier] += 1
 
         return {
-            "team_count": len(teams),
+            "team_count": team_count,
             "total_agents": total_agents,
             "teams_with_leads": teams_with_leads,
             "tier_distribution": tier_distribution,
-            "average_team_size": total_agents / len(teams) if teams else 0
+            "average_team_size": total_agents / team_count if team_count else 0
         }
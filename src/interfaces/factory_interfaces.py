@@ -46,6 +46,8 @@ class IProviderFactory(ABC):
     Strategy Pattern: Allows runtime provider selection.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create_provider(
         self,
@@ -1,7 +1,32 @@
 """Routing module for orchestrator selection and domain classification."""
 
-from src.routing.orchestrator_router import OrchestratorRouter
-from src.routing.domain_classifier import DomainClassifier
-from src.routing.hierarchical_router import HierarchicalRouter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.routing.orchestrator_router import OrchestratorRouter
+    from src.routing.domain_classifier import DomainClassifier
+    from src.routing.hierarchical_router import HierarchicalRouter
+
+# Exported name -> defining submodule; imported on first attribute access (PEP 562)
+_LAZY_EXPORTS = {
+    "OrchestratorRouter": "src.routing.orchestrator_router",
+    "DomainClassifier": "src.routing.domain_classifier",
+    "HierarchicalRouter": "src.routing.hierarchical_router",
+}
 
 __all__ = ["OrchestratorRouter", "DomainClassifier", "HierarchicalRouter"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,32 @@
+"""
+Per-instance memoization shared by the routing classes.
+"""
+
+import functools
+from typing import Callable, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+# Distinct descriptions remembered by the routers' per-instance memos
+ROUTE_CACHE_SIZE = 4096
+
+
+def instance_lru_cache(
+    method: Callable[..., _T], maxsize: Optional[int]
+) -> "functools._lru_cache_wrapper[_T]":
+    """
+    Memoize a bound method for the lifetime of its instance.
+
+    Call from __init__ and store the result under its own attribute.
+    functools.lru_cache on the method itself would key on, and keep alive,
+    every instance; wrapping the bound method keeps one cache per instance
+    that is freed with it.
+
+    Args:
+        method: Bound method to memoize (arguments must be hashable)
+        maxsize: Maximum number of cached calls (None for unbounded)
+
+    Returns:
+        Memoized callable exposing cache_info() and cache_clear()
+    """
+    return functools.lru_cache(maxsize=maxsize)(method)
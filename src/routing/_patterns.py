@@ -0,0 +1,46 @@
+"""
+Keyword/regex pattern helpers shared by the routing classes.
+
+Routing patterns are matched against lowercased task descriptions. Plain
+keywords and whole-word patterns are answered without the regex engine;
+only real patterns are compiled.
+"""
+
+import re
+from typing import Optional
+
+# Characters with special meaning in routing patterns; patterns without them are plain keywords
+REGEX_SYNTAX = frozenset("\\.^$*+?{}[]|()")
+
+
+def is_literal(pattern: str) -> bool:
+    """Check whether a pattern is a plain keyword (no regex syntax)."""
+    return REGEX_SYNTAX.isdisjoint(pattern)
+
+
+# Whole-word patterns such as r"\bfunctor\b" match exactly when the word is one of
+# the description's \w+ tokens, so they are answered by set membership
+_WHOLE_WORD = re.compile(r"\\b(\w+)\\b")
+TOKEN = re.compile(r"\w+")
+
+
+def whole_word(pattern: str) -> Optional[str]:
+    """Return the word of a whole-word pattern, or None for other patterns."""
+    match = _WHOLE_WORD.fullmatch(pattern)
+    return match.group(1).lower() if match else None
+
+
+# Escapes/constructs whose meaning changes if the pattern text is lowercased
+_CASE_SENSITIVE_SYNTAX = re.compile(r"\\[A-Z]|\(\?P")
+
+
+def compile_lowercase(pattern: str) -> re.Pattern:
+    """
+    Compile a pattern for matching against already-lowercased text.
+
+    Lowercasing the pattern instead of using re.IGNORECASE avoids per-character
+    case folding in the regex engine.
+    """
+    if _CASE_SENSITIVE_SYNTAX.search(pattern):
+        return re.compile(pattern, re.IGNORECASE)
+    return re.compile(pattern.lower())
@@ -6,14 +6,83 @@ Week 11: Part of hierarchical agent scaling infrastructure.
 Week 13: Added metrics collection (Priority 3).
 """
 
+import functools
 import re
 import logging
-from typing import Dict, List, Optional
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
 from src.entities import Task
+from src.routing._cache import instance_lru_cache
+from src.routing._patterns import TOKEN, compile_lowercase, is_literal, whole_word
 
 
 logger = logging.getLogger(__name__)
 
+# Distinct descriptions remembered by DomainClassifier.classify
+_CLASSIFY_CACHE_SIZE = 4096
+
+
+def _compile_hyperscan_database(patterns: List[str]):
+    """
+    Compile all regex patterns into one Hyperscan database.
+
+    Optional dependency (the "hyperscan" extra): Hyperscan scans a description
+    against every pattern in a single pass. Returns None if it is not
+    installed or rejects a pattern, in which case the compiled `re` patterns
+    are used.
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.encode("utf-8") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except hyperscan.error as e:
+        logger.debug(f"Hyperscan unavailable for domain patterns: {e}")
+        return None
+    return database
+
+
+def _new_hyperscan_scratch(database):
+    """Allocate Hyperscan scratch space for a database (None without Hyperscan)."""
+    if database is None:
+        return None
+    import hyperscan
+    return hyperscan.Scratch(database)
+
+
+def _record_match(pattern_id: int, start: int, end: int, flags: int, matched: Set[int]) -> None:
+    """Hyperscan match handler: collect the ids of matching patterns."""
+    matched.add(pattern_id)
+
+
+@dataclass(frozen=True)
+class _PatternTables:
+    """Compiled keyword and regex tables shared by DomainClassifier instances."""
+    domains: List[str]
+    declared_domain_ids: List[int]
+    literal_table: List[Tuple[str, int, float]]
+    shared_literals: List[Tuple[str, Tuple[Tuple[int, float], ...]]]
+    word_owners: Dict[str, Tuple[Tuple[int, float], ...]]
+    compiled_patterns: Dict[int, List[Tuple[re.Pattern, float]]]
+    regex_unions: Dict[int, re.Pattern]
+    regex_table: List[Tuple[int, float]]
+    hyperscan: Any
+
 
 class DomainClassifier:
     """
@@ -347,6 +416,14 @@ class DomainClassifier:
         }
     }
 
+    # Tie-breaker when domains score equally (specialized domains first)
+    PRIORITY_ORDER = (
+        "category-theory", "dsl",  # Specialized domains (highest priority)
+        "backend", "frontend", "testing", "devops",  # Core domains
+        "security", "performance", "research", "documentation"  # Support domains
+    )
+    _PRIORITY_INDEX = {domain: rank for rank, domain in enumerate(PRIORITY_ORDER)}
+
     def __init__(self, metrics_collector: Optional['MetricsCollector'] = None):
         """
         Initialize domain classifier with compiled regex patterns.
@@ -354,11 +431,19 @@ class DomainClassifier:
         Args:
             metrics_collector: Optional metrics collector for tracking (Week 13)
         """
-        # Compile patterns for performance
-        self._compiled_patterns: Dict[str, List[re.Pattern]] = {
-            domain: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
-            for domain, patterns in self.DOMAIN_PATTERNS.items()
-        }
+        # Pattern tables are compiled once per class and shared by instances
+        tables = self._compile_patterns()
+        self._domains = tables.domains
+        self._declared_domain_ids = tables.declared_domain_ids
+        self._literal_table = tables.literal_table
+        self._shared_literals = tables.shared_literals
+        self._word_owners = tables.word_owners
+        self._compiled_patterns = tables.compiled_patterns
+        self._regex_unions = tables.regex_unions
+        self._regex_table = tables.regex_table
+        self._hyperscan = tables.hyperscan
+        # Hyperscan scratch space is per instance; the database itself is shared
+        self._hyperscan_scratch = _new_hyperscan_scratch(tables.hyperscan)
 
         # Metrics collection (optional, injected via DIP)
         self.metrics_collector = metrics_collector
@@ -366,8 +451,94 @@ class DomainClassifier:
         # Track last classification for metrics
         self.last_classification_score: float = 0.0
 
+        # Per-instance memo of description -> domain scores
+        self._score_cache = instance_lru_cache(self._score_domains, _CLASSIFY_CACHE_SIZE)
+
         logger.info(f"DomainClassifier initialized with {len(self.DOMAIN_PATTERNS)} domains")
 
+    @classmethod
+    @functools.cache
+    def _compile_patterns(cls) -> "_PatternTables":
+        """
+        Build the keyword tables and compile the regex patterns for this class.
+
+        Cached per class, so only the first DomainClassifier pays for the
+        pattern compilation (and the Hyperscan database build, if installed).
+        """
+        # Domains in tie-break priority order (unlisted domains last); scans
+        # accumulate into lists indexed by position in this list
+        unranked = len(cls.PRIORITY_ORDER)
+        domains: List[str] = sorted(
+            cls.DOMAIN_PATTERNS, key=lambda d: cls._PRIORITY_INDEX.get(d, unranked)
+        )
+        domain_ids: Dict[str, int] = {domain: i for i, domain in enumerate(domains)}
+        # Domain ids in DOMAIN_PATTERNS order (classify_multi's stable ordering)
+        declared_domain_ids: List[int] = [domain_ids[d] for d in cls.DOMAIN_PATTERNS]
+
+        # Literal keywords (no regex syntax) are matched with C-level substring
+        # search on the lowercased description; only real patterns use regex.
+        # Each keyword maps to its owners: (domain id, DOMAIN_KEYWORD_WEIGHTS
+        # weight, default 1.0), so a keyword shared by several domains
+        # (e.g. "cache") is searched once and credits all of them.
+        literal_owners: Dict[str, List[Tuple[int, float]]] = {}
+        # Whole-word patterns are looked up by the description's tokens
+        word_owners: Dict[str, List[Tuple[int, float]]] = {}
+        # Remaining regex patterns as (compiled, weight) pairs per domain id
+        compiled_patterns: Dict[int, List[Tuple[re.Pattern, float]]] = {}
+        regex_sources: List[str] = []
+        # Flat (domain id, weight) table; Hyperscan reports matches by table index
+        regex_table: List[Tuple[int, float]] = []
+        for domain, patterns in cls.DOMAIN_PATTERNS.items():
+            domain_weights = cls.DOMAIN_KEYWORD_WEIGHTS.get(domain, {})
+            domain_id = domain_ids[domain]
+            regexes = []
+            for pattern in patterns:
+                weight = domain_weights.get(pattern, 1.0)
+                word = whole_word(pattern)
+                if word is not None:
+                    word_owners.setdefault(word, []).append((domain_id, weight))
+                elif is_literal(pattern):
+                    literal_owners.setdefault(pattern.lower(), []).append((domain_id, weight))
+                else:
+                    regexes.append((compile_lowercase(pattern), weight))
+                    regex_sources.append(pattern)
+                    regex_table.append((domain_id, weight))
+            if regexes:
+                compiled_patterns[domain_id] = regexes
+
+        # Most keywords have a single owner and stay in a flat table; only the
+        # shared ones pay for the inner owners loop
+        literal_table: List[Tuple[str, int, float]] = [
+            (keyword, *owners[0]) for keyword, owners in literal_owners.items() if len(owners) == 1
+        ]
+        shared_literals: List[Tuple[str, Tuple[Tuple[int, float], ...]]] = [
+            (keyword, tuple(owners))
+            for keyword, owners in literal_owners.items()
+            if len(owners) > 1
+        ]
+        # One alternation per domain over its regex patterns: a single search
+        # rules out the whole domain before any per-pattern search is attempted
+        # (finditer on the union alone would miss overlapping matches)
+        regex_unions: Dict[int, re.Pattern] = {
+            domain_id: re.compile(
+                "|".join(f"(?:{compiled.pattern})" for compiled, _ in patterns),
+                re.IGNORECASE if any(c.flags & re.IGNORECASE for c, _ in patterns) else 0,
+            )
+            for domain_id, patterns in compiled_patterns.items()
+        }
+
+        return _PatternTables(
+            domains=domains,
+            declared_domain_ids=declared_domain_ids,
+            literal_table=literal_table,
+            shared_literals=shared_literals,
+            word_owners={word: tuple(owners) for word, owners in word_owners.items()},
+            compiled_patterns=compiled_patterns,
+            regex_unions=regex_unions,
+            regex_table=regex_table,
+            hyperscan=_compile_hyperscan_database(regex_sources),
+        )
+
     def classify(self, task: Task) -> str:
         """
         Classify task into primary domain using weighted keyword matching.
@@ -394,61 +565,96 @@ class DomainClassifier:
             - category-theory: functor (weight 10) = 10
             - Result: category-theory wins
         """
-        description = task.description.lower()
+        domain, max_score, tied = self._classify_description(task.description.lower())
 
-        # Calculate weighted scores per domain
-        domain_scores: Dict[str, float] = {domain: 0.0 for domain in self.DOMAIN_PATTERNS}
+        # Store for metrics access
+        self.last_classification_score = max_score
 
-        for domain, patterns in self._compiled_patterns.items():
-            domain_weights = self.DOMAIN_KEYWORD_WEIGHTS.get(domain, {})
+        # Skip building log messages when they would be dropped
+        if max_score == 0:
+            # No domain patterns matched
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Task '{task.description[:50]}...' classified as 'general' (no patterns)"
+                )
+        elif logger.isEnabledFor(logging.INFO):
+            preview = task.description[:50]
+            if tied == 1:
+                logger.info(
+                    f"Task '{preview}...' classified as '{domain}' "
+                    f"(weighted score: {max_score:.1f})"
+                )
+            else:
+                logger.info(
+                    f"Task '{preview}...' classified as '{domain}' "
+                    f"(tie-breaker: weighted score {max_score:.1f} across {tied} domains)"
+                )
+        return domain
 
-            for pattern in patterns:
-                if pattern.search(description):
-                    # Get weight for this pattern (default = 1.0)
-                    pattern_str = pattern.pattern
-                    weight = domain_weights.get(pattern_str, 1.0)
-                    domain_scores[domain] += weight
+    def _classify_description(self, description: str) -> Tuple[str, float, int]:
+        """
+        Pick the primary domain of a lowercased description.
 
-        # Find domain with highest score
-        max_score = max(domain_scores.values())
+        Returns:
+            Tuple of (domain, max weighted score, number of domains tied at that score)
+        """
+        scores, _ = self._score_cache(description)
 
-        # Store for metrics access
-        self.last_classification_score = max_score
+        max_score = max(scores)
 
         if max_score == 0:
-            # No domain patterns matched
-            logger.debug(f"Task '{task.description[:50]}...' classified as 'general' (no patterns)")
-            return "general"
+            return "general", max_score, 0
 
-        # Get domain(s) with max score
-        top_domains = [domain for domain, score in domain_scores.items() if score == max_score]
+        # Domain ids follow priority order and index() finds the first of equal
+        # scores, so ties resolve to the highest-priority domain
+        return self._domains[scores.index(max_score)], max_score, scores.count(max_score)
 
-        if len(top_domains) == 1:
-            domain = top_domains[0]
-            logger.info(
-                f"Task '{task.description[:50]}...' classified as '{domain}' "
-                f"(weighted score: {max_score:.1f})"
-            )
-            return domain
+    def _score_domains(self, description: str) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+        """
+        Scan a lowercased description once for all domain patterns.
 
-        # Multiple domains tied - use priority order (specialized domains first)
-        priority_order = [
-            "category-theory", "dsl",  # Specialized domains (highest priority)
-            "backend", "frontend", "testing", "devops",  # Core domains
-            "security", "performance", "research", "documentation"  # Support domains
-        ]
-        for priority_domain in priority_order:
-            if priority_domain in top_domains:
-                logger.info(
-                    f"Task '{task.description[:50]}...' classified as '{priority_domain}' "
-                    f"(tie-breaker: weighted score {max_score:.1f} across {len(top_domains)} domains)"
-                )
-                return priority_domain
+        Shared by classify (weighted scores), classify_multi (match counts)
+        and get_statistics through the per-instance _score_cache, so repeated
+        descriptions are scanned once. Results are tuples indexed by domain
+        id, so no per-task dicts are built.
 
-        # Fallback (should rarely happen)
-        domain = top_domains[0]
-        logger.warning(f"Task '{task.description[:50]}...' classified as '{domain}' (fallback)")
-        return domain
+        Returns:
+            Tuple of (weighted score per domain id, match count per domain id)
+        """
+        scores = [0.0] * len(self._domains)
+        counts = [0] * len(self._domains)
+        self._scan_into(description, scores, counts)
+        return tuple(scores), tuple(counts)
+
+    def _scan_into(self, description: str, scores: List[float], counts: List[int]) -> None:
+        """
+        Add each matching pattern's weight and count to lists indexed by domain id.
+
+        Args:
+            description: Lowercased task description
+            scores: Weighted score per domain id (accumulated in place)
+            counts: Match count per domain id (accumulated in place)
+        """
+        for keyword, domain_id, weight in self._literal_table:
+            if keyword in description:
+                scores[domain_id] += weight
+                counts[domain_id] += 1
+
+        for keyword, owners in self._shared_literals:
+            if keyword in description:
+                for domain_id, weight in owners:
+                    scores[domain_id] += weight
+                    counts[domain_id] += 1
+
+        # Only the description's distinct tokens are looked up, not every word
+        for word in self._word_owners.keys() & set(TOKEN.findall(description)):
+            for domain_id, weight in self._word_owners[word]:
+                scores[domain_id] += weight
+                counts[domain_id] += 1
+
+        for domain_id, weight in self._match_regex_patterns(description):
+            scores[domain_id] += weight
+            counts[domain_id] += 1
 
     def classify_multi(self, task: Task, top_n: int = 2) -> List[str]:
         """
@@ -464,18 +670,14 @@ class DomainClassifier:
         Use case: "Build REST API with React frontend and write tests"
             -> ["backend", "frontend", "testing"]
         """
-        description = task.description.lower()
-
-        # Count matches per domain
-        match_counts: Dict[str, int] = {domain: 0 for domain in self.DOMAIN_PATTERNS}
+        _, counts = self._score_cache(task.description.lower())
 
-        for domain, patterns in self._compiled_patterns.items():
-            for pattern in patterns:
-                if pattern.search(description):
-                    match_counts[domain] += 1
-
-        # Sort by match count (descending)
-        sorted_domains = sorted(match_counts.items(), key=lambda x: x[1], reverse=True)
+        # Sort by match count (descending), stable in DOMAIN_PATTERNS order
+        sorted_domains = sorted(
+            ((self._domains[i], counts[i]) for i in self._declared_domain_ids),
+            key=lambda x: x[1],
+            reverse=True,
+        )
 
         # Filter out zero matches
         result = [domain for domain, count in sorted_domains if count > 0][:top_n]
@@ -483,13 +685,78 @@ class DomainClassifier:
         if not result:
             result = ["general"]
 
-        logger.info(
-            f"Task '{task.description[:50]}...' multi-classified as {result} "
-            f"(match counts: {dict(sorted_domains[:top_n])})"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Task '{task.description[:50]}...' multi-classified as {result} "
+                f"(match counts: {dict(sorted_domains[:top_n])})"
+            )
 
         return result
 
+    def classify_many(self, tasks: List[Task]) -> List[Tuple[str, float]]:
+        """
+        Classify a batch of tasks.
+
+        Args:
+            tasks: Tasks to classify
+
+        Returns:
+            (domain, weighted score) per task, in task order; the same values
+            classify() and last_classification_score would give
+
+        Each distinct description is classified once and no per-task log
+        lines are emitted.
+        """
+        classified: Dict[str, Tuple[str, float]] = {}
+        results = []
+        for task in tasks:
+            description = task.description.lower()
+            result = classified.get(description)
+            if result is None:
+                domain, max_score, _ = self._classify_description(description)
+                result = classified[description] = (domain, max_score)
+            results.append(result)
+
+        if results:
+            # Same value classify() would have left behind for the last task
+            self.last_classification_score = results[-1][1]
+        return results
+
+    def _match_regex_patterns(self, description: str) -> List[Tuple[int, float]]:
+        """
+        Find the regex patterns (not literal keywords) matching a description.
+
+        Args:
+            description: Lowercased task description
+
+        Returns:
+            (domain id, weight) of each matching pattern
+        """
+        if self._hyperscan is not None:
+            matched_ids: Set[int] = set()
+            try:
+                self._hyperscan.scan(
+                    description.encode("utf-8"),
+                    match_event_handler=_record_match,
+                    context=matched_ids,
+                    scratch=self._hyperscan_scratch,
+                )
+            except Exception as e:  # hyperscan.error; the module is imported lazily
+                logger.debug(f"Hyperscan scan failed, using re patterns: {e}")
+            else:
+                return [self._regex_table[pattern_id] for pattern_id in matched_ids]
+
+        matches: List[Tuple[int, float]] = []
+        for domain_id, union in self._regex_unions.items():
+            if not union.search(description):
+                continue
+            matches.extend(
+                (domain_id, weight)
+                for compiled, weight in self._compiled_patterns[domain_id]
+                if compiled.search(description)
+            )
+        return matches
+
     def get_statistics(self, tasks: List[Task]) -> Dict[str, int]:
         """
         Get domain distribution statistics for a batch of tasks.
@@ -501,13 +768,23 @@ class DomainClassifier:
             Dict mapping domain to task count
 
         Use case: Analyze task distribution across domains for load balancing
+
+        Each distinct description is scored once and counted with its
+        multiplicity; per-task log lines are replaced by the summary below.
         """
         domain_counts: Dict[str, int] = {domain: 0 for domain in self.DOMAIN_PATTERNS}
         domain_counts["general"] = 0
 
-        for task in tasks:
-            domain = self.classify(task)
-            domain_counts[domain] += 1
+        descriptions = Counter(task.description.lower() for task in tasks)
+        for description, count in descriptions.items():
+            domain, _, _ = self._classify_description(description)
+            domain_counts[domain] += count
+
+        if tasks:
+            # Same value classify() would have left behind for the last task
+            _, self.last_classification_score, _ = self._classify_description(
+                tasks[-1].description.lower()
+            )
 
         logger.info(f"Domain statistics: {domain_counts}")
         return domain_counts
@@ -5,16 +5,98 @@ Clean Architecture: Strategy pattern for multi-level routing.
 Week 11: Core infrastructure for 15-agent scaling.
 """
 
+import functools
 import re
 import logging
-from typing import List, Optional, Tuple
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
 from src.entities import Task, Agent
+from src.routing._cache import ROUTE_CACHE_SIZE, instance_lru_cache
+from src.routing._patterns import REGEX_SYNTAX, TOKEN, compile_lowercase, is_literal, whole_word
 from src.routing.orchestrator_router import OrchestratorRouter
 from src.routing.domain_classifier import DomainClassifier
 
 
 logger = logging.getLogger(__name__)
 
+# (pattern, keyword) substring checks, (pattern, word) token checks,
+# (required prefix, compiled regex) pairs
+_PatternMatchers = Tuple[
+    List[Tuple[str, str]], List[Tuple[str, str]], List[Tuple[str, "re.Pattern[str]"]]
+]
+
+
+def _required_prefix(pattern: str) -> str:
+    """
+    Return the literal text every match of pattern starts with ("" if unknown).
+
+    A leading word boundary is skipped; the prefix stops at the first regex
+    syntax character and drops a final character made optional by ?, * or {.
+    """
+    if "|" in pattern:
+        return ""
+    if pattern.startswith("\\b"):
+        pattern = pattern[2:]
+    end = 0
+    while end < len(pattern) and pattern[end] not in REGEX_SYNTAX:
+        end += 1
+    if end < len(pattern) and pattern[end] in "?*{":
+        end -= 1
+    return pattern[:max(end, 0)].lower()
+
+
+def _split_patterns(patterns: List[str]) -> _PatternMatchers:
+    """
+    Split tier patterns by how they can be matched against a lowercased description.
+
+    Plain keywords become substring checks and whole-word patterns become
+    token-set lookups; only the remaining patterns are compiled as regexes,
+    each gated by the literal prefix its matches must start with.
+    """
+    keywords, words, regexes = [], [], []
+    for pattern in patterns:
+        word = whole_word(pattern)
+        if word is not None:
+            words.append((pattern, word))
+        elif is_literal(pattern):
+            keywords.append((pattern, pattern.lower()))
+        else:
+            regexes.append((_required_prefix(pattern), compile_lowercase(pattern)))
+    return keywords, words, regexes
+
+
+def _find_pattern(description: str, tokens: Set[str], matchers: _PatternMatchers) -> Optional[str]:
+    """Return the first matching pattern (keywords, then words, then regexes), or None."""
+    keywords, words, regexes = matchers
+    for pattern, keyword in keywords:
+        if keyword in description:
+            return pattern
+    for pattern, word in words:
+        if word in tokens:
+            return pattern
+    for prefix, regex in regexes:
+        if prefix in description and regex.search(description):
+            return regex.pattern
+    return None
+
+
+@dataclass(frozen=True)
+class _AgentIndex:
+    """Agents bucketed for _select_agent, each bucket in original list order."""
+    by_tier: Dict[int, List[Agent]]
+    by_tier_domain: Dict[Tuple[int, Optional[str]], List[Agent]]
+
+
+def _build_agent_index(agents: List[Agent]) -> _AgentIndex:
+    """Bucket agents by tier and by (tier, specialization)."""
+    by_tier: Dict[int, List[Agent]] = {}
+    by_tier_domain: Dict[Tuple[int, Optional[str]], List[Agent]] = {}
+    for agent in agents:
+        by_tier.setdefault(agent.tier, []).append(agent)
+        by_tier_domain.setdefault((agent.tier, agent.specialization), []).append(agent)
+    return _AgentIndex(by_tier=by_tier, by_tier_domain=by_tier_domain)
+
 
 class HierarchicalRouter:
     """
@@ -79,19 +161,38 @@ class HierarchicalRouter:
         self.orchestrator_router = orchestrator_router or OrchestratorRouter()
         self.domain_classifier = domain_classifier or DomainClassifier()
 
-        # Compile tier patterns
-        self._tier_1_regex = [re.compile(p, re.IGNORECASE) for p in self.TIER_1_PATTERNS]
-        self._tier_2_regex = [re.compile(p, re.IGNORECASE) for p in self.TIER_2_PATTERNS]
+        # Tier matchers are compiled once per class and shared by instances
+        self._tier_1_matchers, self._tier_2_matchers = self._compile_patterns()
+
+        # Per-instance memo of description -> tier
+        self._tier_cache = instance_lru_cache(self._description_tier, ROUTE_CACHE_SIZE)
 
         logger.info("HierarchicalRouter initialized (3-tier architecture)")
 
-    def route(self, task: Task, agents: List[Agent]) -> Agent:
+    @classmethod
+    @functools.cache
+    def _compile_patterns(cls) -> Tuple[_PatternMatchers, _PatternMatchers]:
+        """
+        Compile the tier patterns for this class.
+
+        Plain and whole-word keywords skip the regex engine (see
+        _split_patterns). Cached per class, so only the first
+        HierarchicalRouter pays for the split and compilation.
+        """
+        return _split_patterns(cls.TIER_1_PATTERNS), _split_patterns(cls.TIER_2_PATTERNS)
+
+    def route(self, task: Task, agents: List[Agent],
+              agent_index: Optional[_AgentIndex] = None, verbose: bool = True) -> Agent:
         """
         Route task to appropriate agent in hierarchy.
 
         Args:
             task: Task to route
             agents: Available agents
+            agent_index: Prebuilt index of agents (see _build_agent_index);
+                route_batch builds it once for the whole batch
+            verbose: Determine the (informational) orchestration mode and log
+                the routing decision; quiet batch routing skips both
 
         Returns:
             Selected agent
@@ -105,26 +206,34 @@ class HierarchicalRouter:
             3. Select tier (1, 2, or 3)
             4. Find agent matching (domain, tier, capabilities)
         """
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         # Phase 1: Orchestration mode (informational, doesn't affect agent selection)
-        mode = self.orchestrator_router.route(task)
-        logger.debug(f"Task routed to '{mode}' orchestration mode")
+        mode = self.orchestrator_router.route(task) if verbose else None
+        if debug and verbose:
+            logger.debug(f"Task routed to '{mode}' orchestration mode")
 
         # Phase 2: Domain classification
         domain = self.domain_classifier.classify(task)
-        logger.debug(f"Task classified as domain '{domain}'")
+        if debug:
+            logger.debug(f"Task classified as domain '{domain}'")
 
         # Phase 3: Tier selection
         tier = self._determine_tier(task, domain)
-        logger.debug(f"Task requires tier {tier} agent")
+        if debug:
+            logger.debug(f"Task requires tier {tier} agent")
 
         # Phase 4: Agent selection
-        agent = self._select_agent(task, agents, domain, tier)
+        if agent_index is None:
+            agent_index = _build_agent_index(agents)
+        agent = self._select_agent(task, agent_index, domain, tier)
 
         if agent:
-            logger.info(
-                f"Task '{task.description[:50]}...' routed to "
-                f"{agent.role} (tier={agent.tier}, domain={domain}, mode={mode})"
-            )
+            if verbose and logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Task '{task.description[:50]}...' routed to "
+                    f"{agent.role} (tier={agent.tier}, domain={domain}, mode={mode})"
+                )
             return agent
 
         # Fallback: Use capability-based matching (backward compatibility)
@@ -147,32 +256,43 @@ class HierarchicalRouter:
             - Tier 2: Domain-level design, architecture
             - Tier 3: Implementation, execution (default)
         """
-        description = task.description.lower()
+        return self._tier_cache(task.description.lower())
+
+    def _description_tier(self, description: str) -> int:
+        """
+        Determine the tier for a lowercased description (see _determine_tier).
+
+        Called through the per-instance _tier_cache; the tier depends only on
+        the description, so repeated tasks are scanned once.
+        """
+        tokens = set(TOKEN.findall(description))
 
         # Check Tier 1 patterns (orchestration, planning)
-        for pattern in self._tier_1_regex:
-            if pattern.search(description):
-                logger.debug(f"Tier 1 pattern matched: {pattern.pattern}")
-                return 1
+        pattern = _find_pattern(description, tokens, self._tier_1_matchers)
+        if pattern:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Tier 1 pattern matched: {pattern}")
+            return 1
 
         # Check Tier 2 patterns (design, architecture)
-        for pattern in self._tier_2_regex:
-            if pattern.search(description):
-                logger.debug(f"Tier 2 pattern matched: {pattern.pattern}")
-                return 2
+        pattern = _find_pattern(description, tokens, self._tier_2_matchers)
+        if pattern:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Tier 2 pattern matched: {pattern}")
+            return 2
 
         # Default: Tier 3 (implementation, execution)
         logger.debug("No tier-specific patterns matched, defaulting to Tier 3")
         return 3
 
-    def _select_agent(self, task: Task, agents: List[Agent],
+    def _select_agent(self, task: Task, agent_index: _AgentIndex,
                       domain: str, tier: int) -> Optional[Agent]:
         """
         Select specific agent based on domain, tier, and capabilities.
 
         Args:
             task: Task to route
-            agents: Available agents
+            agent_index: Available agents indexed by tier and specialization
             domain: Task domain
             tier: Target tier
 
@@ -183,34 +303,37 @@ class HierarchicalRouter:
             1. Exact match: tier + domain + can_handle
             2. Tier + can_handle (ignore domain)
             3. None (triggers fallback)
-        """
-        # Priority 1: Exact match (tier + domain + can_handle)
-        candidates = [
-            agent for agent in agents
-            if agent.tier == tier
-            and (agent.specialization == domain or domain == "general")
-            and agent.can_handle(task)
-        ]
-
-        if candidates:
-            # Return first candidate (could add load balancing here)
-            agent = candidates[0]
-            logger.debug(f"Exact match: {agent.role} (tier={tier}, domain={domain})")
-            return agent
 
-        # Priority 2: Tier + can_handle (ignore domain)
-        candidates = [
-            agent for agent in agents
-            if agent.tier == tier and agent.can_handle(task)
-        ]
+        Only the agents of the target tier (and domain) are visited, in their
+        original order, and can_handle stops at the first match.
+        """
+        tier_agents = agent_index.by_tier.get(tier, ())
 
-        if candidates:
-            agent = candidates[0]
-            logger.debug(f"Tier match: {agent.role} (tier={tier}, domain mismatch)")
-            return agent
+        # Priority 1: Exact match (tier + domain + can_handle)
+        if domain == "general":
+            exact = tier_agents
+        else:
+            exact = agent_index.by_tier_domain.get((tier, domain), ())
+
+        for agent in exact:
+            if agent.can_handle(task):
+                # Return first candidate (could add load balancing here)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Exact match: {agent.role} (tier={tier}, domain={domain})")
+                return agent
+
+        # Priority 2: Tier + can_handle (ignore domain); agents already
+        # rejected above are skipped
+        if domain != "general":
+            for agent in tier_agents:
+                if agent.specialization != domain and agent.can_handle(task):
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Tier match: {agent.role} (tier={tier}, domain mismatch)")
+                    return agent
 
         # No match
-        logger.debug(f"No agent found for tier={tier}, domain={domain}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"No agent found for tier={tier}, domain={domain}")
         return None
 
     def _fallback_agent_selection(self, task: Task, agents: List[Agent]) -> Agent:
@@ -249,20 +372,35 @@ class HierarchicalRouter:
         logger.warning(f"Fallback selected: {agent.role} (tier={agent.tier})")
         return agent
 
-    def route_batch(self, tasks: List[Task], agents: List[Agent]) -> List[Tuple[Task, Agent]]:
+    def route_batch(self, tasks: List[Task], agents: List[Agent],
+                    verbose: bool = False) -> List[Tuple[Task, Agent]]:
         """
         Route multiple tasks to agents.
 
         Args:
             tasks: Tasks to route
             agents: Available agents
+            verbose: Log each routing decision (and its orchestration mode);
+                off by default so large batches skip per-task logging
 
         Returns:
             List of (task, agent) tuples
 
         Use case: Batch routing for parallel execution planning.
+
+        Routing depends only on the task description, so each distinct
+        description is routed once and its agent reused for repeats.
         """
-        return [(task, self.route(task, agents)) for task in tasks]
+        agent_index = _build_agent_index(agents)
+        routed: Dict[str, Agent] = {}
+        routes = []
+        for task in tasks:
+            agent = routed.get(task.description)
+            if agent is None:
+                agent = self.route(task, agents, agent_index, verbose)
+                routed[task.description] = agent
+            routes.append((task, agent))
+        return routes
 
     def get_routing_stats(self, tasks: List[Task], agents: List[Agent]) -> dict:
         """
@@ -283,17 +421,14 @@ class HierarchicalRouter:
         routes = self.route_batch(tasks, agents)
 
         # Tier distribution
-        tier_counts = {1: 0, 2: 0, 3: 0}
-        for _, agent in routes:
-            tier_counts[agent.tier] += 1
+        tiers = Counter(agent.tier for _, agent in routes)
+        tier_counts = {tier: tiers[tier] for tier in (1, 2, 3)}
 
         # Domain distribution
         domain_counts = self.domain_classifier.get_statistics(tasks)
 
-        # Agent utilization
-        agent_counts = {}
-        for _, agent in routes:
-            agent_counts[agent.role] = agent_counts.get(agent.role, 0) + 1
+        # Agent utilization (in order of first use)
+        agent_counts = dict(Counter(agent.role for _, agent in routes))
 
         return {
             "total_tasks": len(tasks),
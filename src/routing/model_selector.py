@@ -7,9 +7,10 @@ DIP: Returns provider names (abstraction), not concrete implementations.
 Week 13: Multi-model orchestration with intelligent selection.
 """
 
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, FrozenSet, Optional, List, Tuple
+from dataclasses import astuple, dataclass, field
 from enum import Enum
+from src.routing._cache import instance_lru_cache
 
 
 class SelectionCriteria(Enum):
@@ -21,6 +22,17 @@ class SelectionCriteria(Enum):
     BALANCED = "balanced"  # Balance all factors
 
 
+_ANALYSIS_CACHE_SIZE = 4096
+
+# Task keywords per criterion, in the order they are checked
+_CRITERIA_KEYWORDS: Tuple[Tuple[SelectionCriteria, FrozenSet[str]], ...] = (
+    (SelectionCriteria.PRIVACY, frozenset({"offline", "local", "private", "confidential"})),
+    (SelectionCriteria.SPEED, frozenset({"fast", "quick", "urgent", "real-time"})),
+    (SelectionCriteria.QUALITY, frozenset({"accurate", "quality", "critical", "important"})),
+    (SelectionCriteria.COST, frozenset({"cheap", "cost-effective", "budget"})),
+)
+
+
 @dataclass
 class ScoringWeights:
     """
@@ -79,42 +91,54 @@ class ModelCapabilities:
         Returns:
             Score (0.0-100.0)
         """
-        if criteria == SelectionCriteria.SPEED:
-            # Lower latency = higher score
-            # Normalize: 10s = 100, 30s = 33, 60s = 17
-            return min(100, (10 / max(self.avg_latency, 1)) * 100)
-
-        elif criteria == SelectionCriteria.QUALITY:
-            # Higher success rate = higher score
-            return self.success_rate * 100
-
-        elif criteria == SelectionCriteria.COST:
-            # Lower cost = higher score
-            # Free = 100, $9/mo = 89, $32/mo = 68, $50/mo = 50
-            return max(0, 100 - self.cost_per_month * 2)
-
-        elif criteria == SelectionCriteria.PRIVACY:
-            # Offline = 100, online = 0
-            return 0 if self.requires_internet else 100
-
-        elif criteria == SelectionCriteria.BALANCED:
-            # Weighted average of all factors (configurable via weights parameter)
-            if weights is None:
-                weights = ScoringWeights()  # Use defaults
-
-            speed_score = self.get_score(SelectionCriteria.SPEED)
-            quality_score = self.get_score(SelectionCriteria.QUALITY)
-            cost_score = self.get_score(SelectionCriteria.COST)
-            privacy_score = self.get_score(SelectionCriteria.PRIVACY)
-
-            return (
-                (quality_score * weights.quality_weight) +
-                (speed_score * weights.speed_weight) +
-                (cost_score * weights.cost_weight) +
-                (privacy_score * weights.privacy_weight)
-            )
+        scorer = _SCORERS.get(criteria)
+        return scorer(self, weights) if scorer else 0.0
+
+
+def _speed_score(caps: ModelCapabilities, weights: Optional[ScoringWeights]) -> float:
+    """Lower latency = higher score (10s = 100, 30s = 33, 60s = 17)."""
+    return min(100, (10 / max(caps.avg_latency, 1)) * 100)
+
+
+def _quality_score(caps: ModelCapabilities, weights: Optional[ScoringWeights]) -> float:
+    """Higher success rate = higher score."""
+    return caps.success_rate * 100
+
+
+def _cost_score(caps: ModelCapabilities, weights: Optional[ScoringWeights]) -> float:
+    """Lower cost = higher score (free = 100, $9/mo = 82, $32/mo = 36, $50/mo = 0)."""
+    return max(0, 100 - caps.cost_per_month * 2)
+
 
-        return 0.0
+def _privacy_score(caps: ModelCapabilities, weights: Optional[ScoringWeights]) -> float:
+    """Offline = 100, online = 0."""
+    return 0 if caps.requires_internet else 100
+
+
+def _balanced_score(caps: ModelCapabilities, weights: Optional[ScoringWeights]) -> float:
+    """Weighted average of all factors (default ScoringWeights if weights is None)."""
+    if weights is None:
+        weights = ScoringWeights()  # Use defaults
+
+    return (
+        (_quality_score(caps, None) * weights.quality_weight) +
+        (_speed_score(caps, None) * weights.speed_weight) +
+        (_cost_score(caps, None) * weights.cost_weight) +
+        (_privacy_score(caps, None) * weights.privacy_weight)
+    )
+
+
+# Scores a model's capabilities for one criterion (weights apply to BALANCED)
+Scorer = Callable[[ModelCapabilities, Optional[ScoringWeights]], float]
+
+# ModelCapabilities.get_score dispatch: criteria -> scorer(capabilities, weights)
+_SCORERS: Dict[SelectionCriteria, Scorer] = {
+    SelectionCriteria.SPEED: _speed_score,
+    SelectionCriteria.QUALITY: _quality_score,
+    SelectionCriteria.COST: _cost_score,
+    SelectionCriteria.PRIVACY: _privacy_score,
+    SelectionCriteria.BALANCED: _balanced_score,
+}
 
 
 class ModelSelector:
@@ -136,6 +160,18 @@ class ModelSelector:
         self.models = self._initialize_capabilities()
         self.scoring_weights = scoring_weights  # None = use defaults
 
+        # (criteria, weights) -> {provider: score}; capabilities are static,
+        # so each table is computed once (see _score_table)
+        self._score_tables: Dict[Tuple, Dict[str, float]] = {}
+
+        # Fallback chain inputs: providers ranked per criteria (default
+        # weights) and the single most reliable provider
+        self._rankings: Dict[SelectionCriteria, List[str]] = {}
+        self._most_reliable = max(self.models, key=lambda name: self.models[name].success_rate)
+
+        # Per-instance memo of description -> keyword criteria
+        self._keyword_cache = instance_lru_cache(self._keyword_criteria, _ANALYSIS_CACHE_SIZE)
+
     def _initialize_capabilities(self) -> Dict[str, ModelCapabilities]:
         """
         Initialize model capabilities from evaluation data.
@@ -212,15 +248,41 @@ class ModelSelector:
             criteria = self._analyze_task_requirements(task_description, criteria)
 
         # Score each model (pass weights for BALANCED criteria)
-        scores = {
-            name: caps.get_score(criteria, weights=self.scoring_weights)
-            for name, caps in models.items()
-        }
+        scores = self._score_table(criteria, self.scoring_weights)
 
         # Select highest scoring model
-        best_model = max(scores.items(), key=lambda x: x[1])
+        return max(models, key=scores.__getitem__)
 
-        return best_model[0]
+    def _score_table(
+        self,
+        criteria: SelectionCriteria,
+        weights: Optional[ScoringWeights] = None
+    ) -> Dict[str, float]:
+        """
+        Get every registered model's score for criteria.
+
+        Scores depend only on the (static) capabilities, the criteria and,
+        for BALANCED, the weights, so each table is computed once.
+
+        Args:
+            criteria: Selection criteria
+            weights: Optional custom weights for BALANCED scoring
+
+        Returns:
+            Dict mapping provider name to score, in registry order
+        """
+        if criteria != SelectionCriteria.BALANCED:
+            weights = None
+        key = (criteria, astuple(weights) if weights is not None else None)
+
+        table = self._score_tables.get(key)
+        if table is None:
+            table = {
+                name: caps.get_score(criteria, weights=weights)
+                for name, caps in self.models.items()
+            }
+            self._score_tables[key] = table
+        return table
 
     def _analyze_task_requirements(
         self,
@@ -243,25 +305,24 @@ class ModelSelector:
         Returns:
             Inferred selection criteria
         """
-        desc_lower = task_description.lower()
-
-        # Privacy keywords
-        if any(kw in desc_lower for kw in ["offline", "local", "private", "confidential"]):
-            return SelectionCriteria.PRIVACY
+        criteria = self._keyword_cache(task_description.lower())
+        if criteria is not None:
+            return criteria
 
-        # Speed keywords
-        if any(kw in desc_lower for kw in ["fast", "quick", "urgent", "real-time"]):
-            return SelectionCriteria.SPEED
-
-        # Quality keywords
-        if any(kw in desc_lower for kw in ["accurate", "quality", "critical", "important"]):
-            return SelectionCriteria.QUALITY
+        return default_criteria
 
-        # Cost keywords
-        if any(kw in desc_lower for kw in ["cheap", "cost-effective", "budget"]):
-            return SelectionCriteria.COST
+    def _keyword_criteria(self, desc_lower: str) -> Optional[SelectionCriteria]:
+        """
+        Return the first criterion whose keywords occur in a lowercased
+        description, or None.
 
-        return default_criteria
+        Keywords match as substrings ("locally" implies PRIVACY). Called
+        through the per-instance _keyword_cache.
+        """
+        for criteria, keywords in _CRITERIA_KEYWORDS:
+            if any(kw in desc_lower for kw in keywords):
+                return criteria
+        return None
 
     def get_fallback_chain(
         self,
@@ -285,26 +346,20 @@ class ModelSelector:
         """
         chain = [primary]
 
-        # Get remaining models scored by criteria
-        remaining = {
-            name: caps.get_score(criteria)
-            for name, caps in self.models.items()
-            if name != primary
-        }
+        # Add best remaining model (rankings are best-first, ties in registry order)
+        ranking = self._rankings.get(criteria)
+        if ranking is None:
+            scores = self._score_table(criteria)
+            ranking = sorted(self.models, key=scores.__getitem__, reverse=True)
+            self._rankings[criteria] = ranking
 
-        # Add best remaining model
-        if remaining:
-            next_best = max(remaining.items(), key=lambda x: x[1])[0]
+        next_best = next((name for name in ranking if name != primary), None)
+        if next_best is not None:
             chain.append(next_best)
 
         # Add most reliable model (if not already in chain)
-        most_reliable = max(
-            self.models.items(),
-            key=lambda x: x[1].success_rate
-        )[0]
-
-        if most_reliable not in chain:
-            chain.append(most_reliable)
+        if self._most_reliable not in chain:
+            chain.append(self._most_reliable)
 
         return chain
 
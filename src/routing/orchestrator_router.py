@@ -5,15 +5,30 @@ Clean Architecture: Strategy pattern for selecting orchestration approach.
 DIP: Depends on abstractions (task patterns), not concrete implementations.
 """
 
+import functools
 import re
 import logging
+from collections import Counter
 from typing import List, Tuple
 from src.entities import Task
+from src.routing._cache import ROUTE_CACHE_SIZE, instance_lru_cache
+from src.routing._patterns import compile_lowercase
 
 
 logger = logging.getLogger(__name__)
 
 
+def _matches(regexes: List[re.Pattern], description: str, kind: str) -> bool:
+    """Check whether any of the regexes matches the description."""
+    for regex in regexes:
+        if regex.search(description):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"{kind} pattern matched: {regex.pattern}")
+            return True
+
+    return False
+
+
 class OrchestratorRouter:
     """
     Routes tasks to appropriate orchestrator based on complexity.
@@ -79,13 +94,40 @@ class OrchestratorRouter:
         """
         self.enable_sdk = enable_sdk
 
-        # Compile patterns for performance
-        self._multi_agent_regex = [re.compile(p, re.IGNORECASE) for p in self.MULTI_AGENT_PATTERNS]
-        self._research_regex = [re.compile(p, re.IGNORECASE) for p in self.RESEARCH_PATTERNS]
-        self._review_regex = [re.compile(p, re.IGNORECASE) for p in self.REVIEW_PATTERNS]
+        # Compiled patterns are shared by every instance of the class
+        self._multi_agent_regex, self._research_regex, self._review_regex = (
+            self._compile_patterns()
+        )
+
+        self._pattern_sets = {
+            "Multi-agent": self._multi_agent_regex,
+            "Research": self._research_regex,
+            "Review": self._review_regex,
+        }
+
+        # Per-instance memo of (kind, description) -> matched
+        self._pattern_cache = instance_lru_cache(
+            self._has_pattern, len(self._pattern_sets) * ROUTE_CACHE_SIZE
+        )
 
         logger.info(f"OrchestratorRouter initialized (SDK enabled: {enable_sdk})")
 
+    @classmethod
+    @functools.cache
+    def _compile_patterns(cls) -> Tuple[List[re.Pattern], List[re.Pattern], List[re.Pattern]]:
+        """
+        Compile the multi-agent, research and review patterns for this class.
+
+        Patterns are matched against lowercased descriptions (see
+        compile_lowercase). Cached per class, so only the first
+        OrchestratorRouter compiles them.
+        """
+        return (
+            [compile_lowercase(p) for p in cls.MULTI_AGENT_PATTERNS],
+            [compile_lowercase(p) for p in cls.RESEARCH_PATTERNS],
+            [compile_lowercase(p) for p in cls.REVIEW_PATTERNS],
+        )
+
     def route(self, task: Task) -> str:
         """
         Determine orchestration mode for task.
@@ -97,43 +139,47 @@ class OrchestratorRouter:
             "openai-agents" or "simple"
         """
         if not self.enable_sdk:
-            logger.debug(f"SDK disabled, using simple mode for task: {task.task_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"SDK disabled, using simple mode for task: {task.task_id}")
             return "simple"
 
-        # Analyze task characteristics
-        is_multi_agent = self._is_multi_agent_task(task)
-        is_research = self._is_research_task(task)
-        is_review = self._is_review_task(task)
-
-        # Decision logic
-        if is_multi_agent:
-            logger.info(
-                f"Task {task.task_id} routed to SIMPLE mode: "
-                f"multi-agent workflow detected"
-            )
+        description = task.description.lower()
+        log = logger.isEnabledFor(logging.INFO)
+
+        # Decision logic (each characteristic is only scanned when it can
+        # still change the outcome)
+        if self._pattern_cache("Multi-agent", description):
+            if log:
+                logger.info(
+                    f"Task {task.task_id} routed to SIMPLE mode: "
+                    f"multi-agent workflow detected"
+                )
             return "simple"
 
-        if is_research and len(task.description.split()) > 20:
+        if len(task.description.split()) > 20 and self._pattern_cache("Research", description):
             # Complex research tasks may benefit from planner
-            logger.info(
-                f"Task {task.task_id} routed to SIMPLE mode: "
-                f"complex research task"
-            )
+            if log:
+                logger.info(
+                    f"Task {task.task_id} routed to SIMPLE mode: "
+                    f"complex research task"
+                )
             return "simple"
 
-        if is_review:
+        if self._pattern_cache("Review", description):
             # Review tasks may need multiple iterations
-            logger.info(
-                f"Task {task.task_id} routed to SIMPLE mode: "
-                f"review task with potential iterations"
-            )
+            if log:
+                logger.info(
+                    f"Task {task.task_id} routed to SIMPLE mode: "
+                    f"review task with potential iterations"
+                )
             return "simple"
 
         # Default: use SDK for single-agent tasks
-        logger.info(
-            f"Task {task.task_id} routed to SDK mode: "
-            f"single-agent task"
-        )
+        if log:
+            logger.info(
+                f"Task {task.task_id} routed to SDK mode: "
+                f"single-agent task"
+            )
         return "openai-agents"
 
     def route_batch(self, tasks: List[Task]) -> List[Tuple[Task, str]]:
@@ -148,6 +194,22 @@ class OrchestratorRouter:
         """
         return [(task, self.route(task)) for task in tasks]
 
+    def _has_pattern(self, kind: str, description: str) -> bool:
+        """
+        Check a lowercased description against one pattern set.
+
+        Called through the per-instance _pattern_cache, so repeated
+        descriptions and get_routing_stats reuse the scans done by route.
+
+        Args:
+            kind: "Multi-agent", "Research" or "Review"
+            description: Lowercased task description
+
+        Returns:
+            True if any pattern of the set matches
+        """
+        return _matches(self._pattern_sets[kind], description, kind)
+
     def _is_multi_agent_task(self, task: Task) -> bool:
         """
         Check if task requires multi-agent coordination.
@@ -158,14 +220,7 @@ class OrchestratorRouter:
         Returns:
             True if multi-agent patterns detected
         """
-        description = task.description
-
-        for regex in self._multi_agent_regex:
-            if regex.search(description):
-                logger.debug(f"Multi-agent pattern matched: {regex.pattern}")
-                return True
-
-        return False
+        return self._pattern_cache("Multi-agent", task.description.lower())
 
     def _is_research_task(self, task: Task) -> bool:
         """
@@ -177,14 +232,7 @@ class OrchestratorRouter:
         Returns:
             True if research patterns detected
         """
-        description = task.description
-
-        for regex in self._research_regex:
-            if regex.search(description):
-                logger.debug(f"Research pattern matched: {regex.pattern}")
-                return True
-
-        return False
+        return self._pattern_cache("Research", task.description.lower())
 
     def _is_review_task(self, task: Task) -> bool:
         """
@@ -196,14 +244,7 @@ class OrchestratorRouter:
         Returns:
             True if review patterns detected
         """
-        description = task.description
-
-        for regex in self._review_regex:
-            if regex.search(description):
-                logger.debug(f"Review pattern matched: {regex.pattern}")
-                return True
-
-        return False
+        return self._pattern_cache("Review", task.description.lower())
 
     def get_routing_stats(self, tasks: List[Task]) -> dict:
         """
@@ -217,12 +258,15 @@ class OrchestratorRouter:
         """
         routes = self.route_batch(tasks)
 
-        sdk_count = sum(1 for _, mode in routes if mode == "openai-agents")
-        simple_count = sum(1 for _, mode in routes if mode == "simple")
+        modes = Counter(mode for _, mode in routes)
+        sdk_count = modes["openai-agents"]
+        simple_count = modes["simple"]
 
-        multi_agent_count = sum(1 for task in tasks if self._is_multi_agent_task(task))
-        research_count = sum(1 for task in tasks if self._is_research_task(task))
-        review_count = sum(1 for task in tasks if self._is_review_task(task))
+        # Only characteristics route_batch short-circuited past are scanned here
+        descriptions = [task.description.lower() for task in tasks]
+        multi_agent_count = sum(1 for d in descriptions if self._pattern_cache("Multi-agent", d))
+        research_count = sum(1 for d in descriptions if self._pattern_cache("Research", d))
+        review_count = sum(1 for d in descriptions if self._pattern_cache("Review", d))
 
         return {
             "total_tasks": len(tasks),
@@ -8,7 +8,8 @@ Clean Architecture: Strategy pattern for team-based routing.
 """
 
 import logging
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 from src.entities import Task, Agent, AgentTeam
 from src.routing.domain_classifier import DomainClassifier
 
@@ -16,6 +17,47 @@ from src.routing.domain_classifier import DomainClassifier
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _TeamIndex:
+    """Teams looked up by _select_team; the first team wins on duplicates."""
+    by_name: Dict[str, AgentTeam]
+    by_domain: Dict[str, AgentTeam]
+    orchestration: Optional[AgentTeam]
+
+
+def _build_team_index(teams: List[AgentTeam]) -> _TeamIndex:
+    """Index teams by name and domain, and find the orchestration team."""
+    by_name: Dict[str, AgentTeam] = {}
+    by_domain: Dict[str, AgentTeam] = {}
+    orchestration = None
+    for team in teams:
+        by_name.setdefault(team.name, team)
+        by_domain.setdefault(team.domain, team)
+        if orchestration is None and (team.name == "Orchestration" or team.domain == "general"):
+            orchestration = team
+    return _TeamIndex(by_name=by_name, by_domain=by_domain, orchestration=orchestration)
+
+
+def _find_agent_team(teams: List[AgentTeam], agent: Agent) -> Optional[AgentTeam]:
+    """Find the first team with an agent equal to agent."""
+    return next((team for team in teams if agent in team.agents), None)
+
+
+def _build_agent_team_index(teams: List[AgentTeam]) -> Dict[int, Optional[AgentTeam]]:
+    """
+    Map id(agent) of every team member to _find_agent_team's answer.
+
+    Agents are unhashable dataclasses, so they are keyed by identity; the
+    team is still resolved by equality, exactly as the linear scan does.
+    """
+    index: Dict[int, Optional[AgentTeam]] = {}
+    for team in teams:
+        for agent in team.agents:
+            if id(agent) not in index:
+                index[id(agent)] = _find_agent_team(teams, agent)
+    return index
+
+
 class TeamRouter:
     """
     Routes tasks to teams using two-phase strategy.
@@ -35,6 +77,22 @@ class TeamRouter:
     Clean Code: Single responsibility - team selection only.
     """
 
+    # Direct domain → team mapping
+    DOMAIN_TO_TEAM = {
+        "frontend": "Frontend",
+        "backend": "Backend",
+        "testing": "Testing",
+        "devops": "Infrastructure",
+        "research": "Research",
+        "documentation": "Research",  # Documentation → Research team
+        "security": "Backend",  # Security → Backend team (for now)
+        "performance": "Backend",  # Performance → Backend team (for now)
+        "general": "Orchestration",  # General → Orchestration team
+        # Week 13: Specialized teams
+        "category-theory": "Category Theory",  # Category Theory → CT team
+        "dsl": "DSL"  # DSL → DSL team
+    }
+
     def __init__(self, domain_classifier: Optional[DomainClassifier] = None):
         """
         Initialize team router.
@@ -49,7 +107,8 @@ class TeamRouter:
 
         logger.info("TeamRouter initialized (two-phase routing)")
 
-    def route(self, task: Task, teams: List[AgentTeam]) -> Agent:
+    def route(self, task: Task, teams: List[AgentTeam],
+              team_index: Optional[_TeamIndex] = None) -> Agent:
         """
         Route task to agent via two-phase strategy.
 
@@ -59,6 +118,8 @@ class TeamRouter:
         Args:
             task: Task to route
             teams: Available agent teams
+            team_index: Prebuilt index of teams (see _build_team_index);
+                route_batch builds it once for the whole batch
 
         Returns:
             Selected agent (from chosen team)
@@ -72,8 +133,32 @@ class TeamRouter:
             3. Let team route internally to agent
             4. Record metrics (Week 13)
         """
+        # Classify task domain
+        domain = self.domain_classifier.classify(task)
+        return self._route_classified(
+            task, teams, domain, self.domain_classifier.last_classification_score, team_index
+        )
+
+    def _route_classified(self, task: Task, teams: List[AgentTeam], domain: str,
+                          domain_score: float, team_index: Optional[_TeamIndex]) -> Agent:
+        """
+        Route an already classified task to an agent (phases 1-3 of route).
+
+        Args:
+            task: Task to route
+            teams: Available agent teams
+            domain: Classified task domain
+            domain_score: Weighted score of the classification (for metrics)
+            team_index: Prebuilt index of teams, or None
+
+        Returns:
+            Selected agent (from chosen team)
+
+        Raises:
+            ValueError: If no suitable team/agent found
+        """
         # Phase 1: Route to team (stores domain classification)
-        team = self._select_team(task, teams)
+        team = self._select_team(task, teams, domain, team_index)
         logger.debug(f"Task routed to team: {team.name}")
 
         # Phase 2: Team's internal routing
@@ -94,27 +179,30 @@ class TeamRouter:
             self.domain_classifier.metrics_collector.record_routing(
                 task_description=task.description,
                 classified_domain=self._last_classified_domain,
-                domain_score=self.domain_classifier.last_classification_score,
+                domain_score=domain_score,
                 target_team=team.name,
                 target_agent=agent.role
             )
 
         return agent
 
-    def _select_team(self, task: Task, teams: List[AgentTeam]) -> AgentTeam:
+    def _select_team(self, task: Task, teams: List[AgentTeam], domain: str,
+                     team_index: Optional[_TeamIndex] = None) -> AgentTeam:
         """
         Select team based on task domain.
 
         Week 12: Simple domain → team mapping.
 
         Strategy:
-            1. Classify task domain (8 domains)
+            1. Take the classified task domain (8 domains)
             2. Find team with matching domain
             3. Fallback to orchestration team for general/unknown
 
         Args:
             task: Task to route
             teams: Available teams
+            domain: Classified task domain
+            team_index: Prebuilt index of teams (built from teams if omitted)
 
         Returns:
             Selected team
@@ -122,42 +210,27 @@ class TeamRouter:
         Raises:
             ValueError: If no suitable team found
         """
-        # Classify task domain
-        domain = self.domain_classifier.classify(task)
         self._last_classified_domain = domain  # Store for metrics (Week 13)
         logger.debug(f"Task classified as domain: {domain}")
 
-        # Direct domain → team mapping
-        domain_to_team = {
-            "frontend": "Frontend",
-            "backend": "Backend",
-            "testing": "Testing",
-            "devops": "Infrastructure",
-            "research": "Research",
-            "documentation": "Research",  # Documentation → Research team
-            "security": "Backend",  # Security → Backend team (for now)
-            "performance": "Backend",  # Performance → Backend team (for now)
-            "general": "Orchestration",  # General → Orchestration team
-            # Week 13: Specialized teams
-            "category-theory": "Category Theory",  # Category Theory → CT team
-            "dsl": "DSL"  # DSL → DSL team
-        }
+        target_team_name = self.DOMAIN_TO_TEAM.get(domain, "Orchestration")
 
-        target_team_name = domain_to_team.get(domain, "Orchestration")
+        if team_index is None:
+            team_index = _build_team_index(teams)
 
         # Find team by name
-        team = self._get_team_by_name(teams, target_team_name)
+        team = team_index.by_name.get(target_team_name)
         if team:
             return team
 
         # Fallback 1: Try domain match
-        team = self._get_team_by_domain(teams, domain)
+        team = team_index.by_domain.get(domain)
         if team:
             logger.debug(f"Fallback: Found team by domain '{domain}'")
             return team
 
         # Fallback 2: Orchestration team (general purpose)
-        orchestration_team = self._get_orchestration_team(teams)
+        orchestration_team = team_index.orchestration
         if orchestration_team:
             logger.warning(
                 f"No specific team for domain '{domain}', using Orchestration team"
@@ -178,21 +251,6 @@ class TeamRouter:
             f"Domain: '{domain}'. Available teams: {[t.name for t in teams]}"
         )
 
-    def _get_team_by_name(self, teams: List[AgentTeam], name: str) -> Optional[AgentTeam]:
-        """Get team by name."""
-        return next((team for team in teams if team.name == name), None)
-
-    def _get_team_by_domain(self, teams: List[AgentTeam], domain: str) -> Optional[AgentTeam]:
-        """Get team by domain."""
-        return next((team for team in teams if team.domain == domain), None)
-
-    def _get_orchestration_team(self, teams: List[AgentTeam]) -> Optional[AgentTeam]:
-        """Get orchestration team (fallback)."""
-        return next(
-            (team for team in teams if team.name == "Orchestration" or team.domain == "general"),
-            None
-        )
-
     def route_batch(self, tasks: List[Task], teams: List[AgentTeam]) -> List[tuple]:
         """
         Route multiple tasks to teams/agents.
@@ -204,12 +262,20 @@ class TeamRouter:
         Returns:
             List of (task, team, agent) tuples
         """
+        team_index = _build_team_index(teams)
+        agent_teams = _build_agent_team_index(teams)
+        # Classify the whole batch up front (each distinct description once)
+        classified = self.domain_classifier.classify_many(tasks)
+
         results = []
-        for task in tasks:
+        for task, (domain, domain_score) in zip(tasks, classified):
             try:
-                agent = self.route(task, teams)
+                agent = self._route_classified(task, teams, domain, domain_score, team_index)
                 # Find which team this agent belongs to
-                team = next((t for t in teams if agent in t.agents), None)
+                if id(agent) in agent_teams:
+                    team = agent_teams[id(agent)]
+                else:
+                    team = _find_agent_team(teams, agent)
                 results.append((task, team, agent))
             except ValueError as e:
                 logger.error(f"Failed to route task: {e}")
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict, Tuple
 from src.entities import Agent, Task, ExecutionResult, ExecutionStatus, ExecutionContext
 from src.interfaces import (
     IAgentCoordinator,
@@ -58,6 +58,37 @@ class TaskCoordinatorUseCase(IAgentCoordinator):
         self.logger.info(f"Coordination complete: {len(results)} results")
         return results
 
+    async def coordinate_stream(
+        self,
+        tasks: List[Task],
+        agents: List[Agent],
+        context: Optional[ExecutionContext] = None
+    ) -> AsyncIterator[Tuple[int, ExecutionResult]]:
+        """
+        Coordinate task execution, yielding results as each parallel group finishes.
+
+        Streaming variant of coordinate(): callers can display results while
+        later groups still run instead of waiting for the whole plan.
+
+        Yields:
+            (task number, result) pairs; task numbers are 1-based positions in
+            tasks. Tasks that were never executed are yielded last as failures.
+        """
+        self.logger.info(f"Coordinating {len(tasks)} tasks (streaming)")
+
+        plan = await self.task_planner.create_plan(tasks, agents, context)
+        pending: Dict[str, int] = {}
+        for number, task in enumerate(tasks, start=1):
+            pending.setdefault(task.task_id or str(number - 1), number)
+
+        async for group_results in self._execute_groups(plan, tasks, agents, context):
+            for task_id, result in group_results.items():
+                if task_id in pending:
+                    yield pending.pop(task_id), result
+
+        for number in pending.values():
+            yield number, self._create_failure_result("Not executed")
+
     async def coordinate_task(
         self,
         task: Task,
@@ -147,19 +178,36 @@ class TaskCoordinatorUseCase(IAgentCoordinator):
 
         Clean Code: Focused on execution flow.
         """
-        results = {}
+        results: Dict[str, ExecutionResult] = {}
+        async for group_results in self._execute_groups(plan, tasks, agents, context):
+            results.update(group_results)
+
+        # Return results in original task order
+        return self._order_results(results, tasks)
+
+    async def _execute_groups(
+        self,
+        plan: ExecutionPlan,
+        tasks: List[Task],
+        agents: List[Agent],
+        context: Optional[ExecutionContext]
+    ) -> AsyncIterator[Dict[str, ExecutionResult]]:
+        """
+        Execute the plan's parallel groups in order.
+
+        Shared by coordinate() and coordinate_stream().
+
+        Yields:
+            Results of each group, keyed by task id
+        """
         task_map = {t.task_id or str(i): t for i, t in enumerate(tasks)}
         agent_map = {a.role: a for a in agents}
 
         # Execute each parallel group sequentially
         for group in plan.parallel_groups:
-            group_results = await self._execute_parallel_group(
+            yield await self._execute_parallel_group(
                 group, plan, task_map, agent_map, context
             )
-            results.update(group_results)
-
-        # Return results in original task order
-        return self._order_results(results, tasks)
 
     async def _execute_parallel_group(
         self,
@@ -244,7 +292,7 @@ class TaskCoordinatorUseCase(IAgentCoordinator):
                     task, agent, context, task_id, attempt
                 )
 
-                if result.status == ExecutionStatus.SUCCESS:
+                if result.status is ExecutionStatus.SUCCESS:
                     return result
 
                 if attempt < self.max_retries - 1:
@@ -283,7 +331,7 @@ class TaskCoordinatorUseCase(IAgentCoordinator):
             context=context
         )
 
-        if result.status != ExecutionStatus.SUCCESS:
+        if result.status is not ExecutionStatus.SUCCESS:
             self.logger.warning(f"Task {task_id} failed: {result.errors}")
         else:
             self.logger.info(f"Task {task_id} completed successfully")
@@ -7,6 +7,7 @@ Tests provider factory, mock provider, and provider interfaces.
 import pytest
 import os
 from src.factories.provider_factory import ProviderFactory
+from src.factories.provider_creators import reset_env_cache
 from src.adapters.llm.mock_provider import MockLLMProvider
 from src.interfaces import ITextGenerator
 
@@ -19,6 +20,11 @@ class TestProviderIntegration:
         """Create provider factory."""
         return ProviderFactory()
 
+    @pytest.fixture
+    def pooled_factory(self):
+        """Create provider factory that pools instances."""
+        return ProviderFactory(cache_instances=True)
+
     def test_create_mock_provider(self, factory):
         """Test creating mock provider via factory."""
         provider = factory.create_provider("mock")
@@ -147,4 +153,107 @@ class TestProviderIntegration:
         provider = factory.create_provider("new")
 
         messages = [{"role": "user", "content": "test"}]
-        assert provider.generate(messages) == "New: test"
\ No newline at end of file
+        assert provider.generate(messages) == "New: test"
+
+    def test_provider_instances_cached_per_config(self, pooled_factory):
+        """Test that identical type/config pairs reuse one provider instance."""
+        provider1 = pooled_factory.create_provider("mock", {"response": "Same"})
+        provider2 = pooled_factory.create_provider("mock", {"response": "Same"})
+        provider3 = pooled_factory.create_provider("mock", {"response": "Other"})
+
+        assert provider1 is provider2
+        assert provider1 is not provider3
+
+    def test_provider_cache_disabled_by_default(self, factory):
+        """Test that factories return fresh instances unless pooling is enabled."""
+        assert factory.create_provider("mock") is not factory.create_provider("mock")
+
+    def test_invalidate_drops_cached_instances(self, pooled_factory):
+        """Test that invalidate() forces a new instance on next create."""
+        provider1 = pooled_factory.create_provider("mock")
+        pooled_factory.invalidate("mock")
+
+        assert pooled_factory.create_provider("mock") is not provider1
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_cached_providers(self, pooled_factory):
+        """Test that close_all() awaits async close() and empties the cache."""
+        closed = []
+
+        class ClosableProvider(ITextGenerator):
+            def generate(self, messages, config=None) -> str:
+                return "closable"
+
+            async def close(self):
+                closed.append(self)
+
+        pooled_factory.register_provider("closable", ClosableProvider)
+        provider = pooled_factory.create_provider("closable")
+
+        await pooled_factory.close_all()
+
+        assert closed == [provider]
+        assert pooled_factory.create_provider("closable") is not provider
+
+    def test_default_factory_is_process_wide(self):
+        """Test that get_default_factory() returns one shared factory."""
+        from src.factories.provider_factory import get_default_factory
+
+        assert get_default_factory() is get_default_factory()
+        assert isinstance(get_default_factory(), ProviderFactory)
+
+    def test_orchestrator_fallback_reuses_pooled_providers(self, pooled_factory):
+        """Test that the auto orchestrator resolves providers through the factory pool."""
+        orchestrator = pooled_factory.create_provider("auto", {"available_providers": ["mock"]})
+
+        assert orchestrator._get_provider("mock") is pooled_factory.create_provider("mock")
+
+    def test_orchestrator_criteria_parsed_case_insensitively(self, factory):
+        """Test that orchestrator criteria names map to SelectionCriteria."""
+        from src.routing.model_selector import SelectionCriteria
+
+        fast = factory.create_provider("auto", {"criteria": "SPEED"})
+        fallback = factory.create_provider("auto", {"criteria": "unknown"})
+
+        assert fast.criteria is SelectionCriteria.SPEED
+        assert fallback.criteria is SelectionCriteria.BALANCED
+
+    def test_orchestrator_skips_unavailable_providers(self, factory, monkeypatch):
+        """Test that the auto orchestrator drops providers whose probe fails."""
+        monkeypatch.delenv("XAI_API_KEY", raising=False)
+        reset_env_cache()
+
+        try:
+            orchestrator = factory.create_provider(
+                "auto", {"available_providers": ["mock", "grok"]}
+            )
+        finally:
+            monkeypatch.undo()
+            reset_env_cache()
+
+        assert orchestrator.available_providers == ["mock"]
+
+    def test_list_providers_includes_metadata(self, factory):
+        """Test listing providers exposes metadata for built-ins and custom ones."""
+        class CustomProvider(ITextGenerator):
+            def generate(self, messages, config=None) -> str:
+                return "custom"
+
+        factory.register_provider("custom", CustomProvider)
+        providers = factory.list_providers()
+
+        assert providers["qwen3_zerogpu"]["class"] == "Qwen3InferenceAdapter"
+        assert providers["custom"] == {}
+        assert "auto" in providers
+
+    def test_freeze_blocks_registration(self, factory):
+        """Test that a frozen factory still creates providers but rejects registration."""
+        factory.freeze()
+        factory.freeze()
+
+        assert factory.frozen
+        assert factory.create_provider("mock") is not None
+        with pytest.raises(RuntimeError, match="frozen"):
+            factory.register_provider("custom", object)
+        with pytest.raises(RuntimeError, match="frozen"):
+            factory.register_creator("custom", object())
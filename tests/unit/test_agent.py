@@ -18,6 +18,13 @@ class TestTask:
         task = Task(description="Review code")
         assert task.priority == 1
 
+    def test_task_is_immutable_and_slotted(self):
+        """Task should be a frozen value object without a per-instance __dict__."""
+        task = Task(description="Review code", task_id="task_1")
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.priority = 5
+
 
 class TestAgent:
     """Test Agent entity - LSP compliance."""
@@ -3,7 +3,7 @@
 import json
 import pytest
 from pathlib import Path
-from src.config import Config
+from src.config import Config, _read_config_file
 
 
 class TestConfig:
@@ -154,4 +154,42 @@ class TestConfigFromFile:
 
         assert merged.provider == "grok"
         assert merged.verbose is True
-        assert merged.timeout == 60  # From file
\ No newline at end of file
+        assert merged.timeout == 60  # From file
+
+    def test_from_file_cached_until_file_changes(self, tmp_path):
+        """Test that an unchanged file is parsed once and edits are picked up."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"provider": "mock"}))
+
+        first = Config.from_file(str(config_file))
+        hits = _read_config_file.cache_info().hits
+        second = Config.from_file(str(config_file))
+        assert _read_config_file.cache_info().hits == hits + 1
+        assert second == first
+
+        config_file.write_text(json.dumps({"provider": "grok", "timeout": 90}))
+
+        assert Config.from_file(str(config_file)).provider == "grok"
+
+    def test_from_file_returns_independent_configs(self, tmp_path):
+        """Test that mutating one loaded config's dicts does not leak into later loads."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"provider_config": {"model": "a"}}))
+
+        first = Config.from_file(str(config_file))
+        first.provider_config["model"] = "b"
+        first.custom_agents.append({"role": "extra"})
+
+        second = Config.from_file(str(config_file))
+        assert second.provider_config == {"model": "a"}
+        assert second.custom_agents == []
+
+    def test_config_is_immutable(self):
+        """Test that merge_cli_args returns a new Config and fields are read-only."""
+        config = Config()
+        merged = config.merge_cli_args(timeout=30)
+
+        assert merged is not config
+        assert config.timeout == 60
+        with pytest.raises(AttributeError):
+            config.timeout = 10
@@ -199,4 +199,36 @@ class TestCoordinateAgentsUseCase:
         # Verify context was passed
         assert len(results) == 1
         call_args = mock_agent_executor.execute.call_args
-        assert call_args[1]["context"] == context
\ No newline at end of file
+        assert call_args[1]["context"] == context
+
+    @pytest.mark.asyncio
+    async def test_coordinate_stream_yields_per_group(
+        self,
+        mock_task_planner,
+        mock_agent_executor,
+        sample_agents,
+        sample_tasks
+    ):
+        """Test streaming yields numbered results group by group, unexecuted last."""
+        from src.use_cases.task_coordinator import TaskCoordinatorUseCase
+
+        mock_task_planner.create_plan.return_value = ExecutionPlan(
+            task_order=["1", "0"],
+            task_assignments={"0": "coder", "1": "tester"},
+            parallel_groups=[["1"], ["0"]]
+        )
+        use_case = TaskCoordinatorUseCase(
+            task_planner=mock_task_planner,
+            agent_executor=mock_agent_executor
+        )
+
+        streamed = [
+            (number, result.status)
+            async for number, result in use_case.coordinate_stream(sample_tasks, sample_agents)
+        ]
+
+        assert streamed == [
+            (2, ExecutionStatus.SUCCESS),
+            (1, ExecutionStatus.SUCCESS),
+            (3, ExecutionStatus.FAILURE),
+        ]
@@ -0,0 +1,215 @@
+"""
+Unit tests for DomainClassifier.
+
+Tests keyword scoring, tie-breaking and multi-domain classification.
+"""
+
+import re
+import sys
+import types
+
+import pytest
+
+from src.entities import Task
+from src.routing.domain_classifier import DomainClassifier
+
+
+@pytest.fixture
+def classifier():
+    """Create a domain classifier."""
+    return DomainClassifier()
+
+
+class _FakeHyperscanError(Exception):
+    """Stand-in for hyperscan.error."""
+
+
+def _fake_hyperscan(fail_compile=False, fail_scan=False):
+    """Build a minimal hyperscan module backed by re."""
+    module = types.ModuleType("hyperscan")
+    module.HS_FLAG_CASELESS = 1
+    module.HS_FLAG_SINGLEMATCH = 2
+    module.HS_FLAG_UTF8 = 4
+    module.HS_FLAG_UCP = 8
+    module.error = _FakeHyperscanError
+
+    class Database:
+        def compile(self, expressions, ids, elements, flags):
+            if fail_compile:
+                raise _FakeHyperscanError("pattern rejected")
+            self.patterns = [
+                (pattern_id, re.compile(expression.decode("utf-8"), re.IGNORECASE))
+                for pattern_id, expression in zip(ids, expressions)
+            ]
+
+        def scan(self, data, match_event_handler, context, scratch):
+            if fail_scan:
+                raise _FakeHyperscanError("scan failed")
+            text = data.decode("utf-8")
+            for pattern_id, compiled in self.patterns:
+                if compiled.search(text):
+                    match_event_handler(pattern_id, 0, 0, 0, context)
+
+    module.Database = Database
+    module.Scratch = lambda database: object()
+    return module
+
+
+class TestClassify:
+    """Test single-domain classification."""
+
+    def test_literal_keywords_are_case_insensitive(self, classifier):
+        """Test that literal keywords match regardless of case."""
+        task = Task(description="Build a REST API with FastAPI", task_id="t1")
+        assert classifier.classify(task) == "backend"
+
+    def test_regex_patterns_still_match(self, classifier):
+        """Test that regex patterns match alongside literal keywords."""
+        task = Task(description="Write unit tests with pytest", task_id="t1")
+        assert classifier.classify(task) == "testing"
+
+    def test_unmatched_task_is_general(self, classifier):
+        """Test that a task matching no pattern is classified as general."""
+        task = Task(description="zzz qqq", task_id="t1")
+        assert classifier.classify(task) == "general"
+        assert classifier.last_classification_score == 0
+
+    def test_weighted_score_is_recorded(self, classifier):
+        """Test that the winning weighted score is kept for metrics."""
+        task = Task(description="Create a functor composition", task_id="t1")
+        assert classifier.classify(task) == "category-theory"
+        assert classifier.last_classification_score > 1.0
+
+    def test_ties_resolved_by_priority_order(self, classifier):
+        """Test that equal scores resolve to the highest-priority domain."""
+        task = Task(description="Style the page css and tune the sql", task_id="t1")
+        assert classifier.classify(task) == "backend"
+        assert classifier.last_classification_score == 1.0
+
+        task = Task(description="Update the readme security section", task_id="t2")
+        assert classifier.classify(task) == "security"
+
+    def test_whole_word_patterns_respect_word_boundaries(self, classifier):
+        """Test that whole-word patterns do not match inside longer words."""
+        apiary = Task(description="Read the apiary notes", task_id="t1")
+        api = Task(description="Call the api.", task_id="t2")
+
+        assert classifier.classify(apiary) == "general"
+        assert classifier.classify(api) == "backend"
+
+
+class TestClassifyMulti:
+    """Test multi-domain classification."""
+
+    def test_returns_top_domains(self, classifier):
+        """Test that the top_n domains by match count are returned."""
+        task = Task(description="Deploy the REST API backend with docker", task_id="t1")
+        domains = classifier.classify_multi(task, top_n=2)
+        assert set(domains) == {"backend", "devops"}
+
+    def test_unmatched_task_is_general(self, classifier):
+        """Test that a task matching no pattern yields ['general']."""
+        task = Task(description="zzz qqq", task_id="t1")
+        assert classifier.classify_multi(task) == ["general"]
+
+    def test_shared_keyword_credits_every_owning_domain(self, classifier):
+        """Test that a keyword listed by several domains counts for each."""
+        task = Task(description="Add a cache layer", task_id="t1")
+        assert classifier.classify_multi(task, top_n=3) == ["backend", "performance"]
+
+
+class TestBatchClassification:
+    """Test batch classification and statistics."""
+
+    def test_get_statistics_counts_general(self, classifier):
+        """Test that statistics count unmatched tasks under general."""
+        tasks = [
+            Task(description="Write unit tests", task_id="t1"),
+            Task(description="zzz", task_id="t2"),
+        ]
+        stats = classifier.get_statistics(tasks)
+        assert stats["testing"] == 1
+        assert stats["general"] == 1
+
+    def test_classify_many_matches_classify(self, classifier):
+        """Test that classify_many gives the same domains and scores as classify."""
+        tasks = [
+            Task(description="Deploy the REST API backend with docker", task_id="t1"),
+            Task(description="zzz", task_id="t2"),
+            Task(description="deploy the rest api backend with DOCKER", task_id="t3"),
+        ]
+        batch = classifier.classify_many(tasks)
+
+        single = DomainClassifier()
+        expected = []
+        for task in tasks:
+            expected.append((single.classify(task), single.last_classification_score))
+        assert batch == expected
+        assert classifier.last_classification_score == expected[-1][1]
+        assert classifier._score_cache.cache_info().misses == 2
+
+
+class TestCaching:
+    """Test per-description memoization and shared pattern tables."""
+
+    def test_repeated_descriptions_are_scored_once(self, classifier):
+        """Test that classify memoizes per description but records the score each call."""
+        task = Task(description="Create a functor composition", task_id="t1")
+        first = classifier.classify(task)
+        classifier.classify(Task(description="zzz", task_id="t2"))
+        assert classifier.classify(task) == first
+        assert classifier.last_classification_score > 1.0
+        assert classifier._score_cache.cache_info().hits == 1
+
+    def test_classify_multi_reuses_classify_scan(self, classifier):
+        """Test that classify and classify_multi share one scan per description."""
+        task = Task(description="Deploy the REST API backend with docker", task_id="t1")
+        classifier.classify(task)
+        classifier.classify_multi(task, top_n=3)
+        info = classifier._score_cache.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_instances_share_compiled_patterns(self):
+        """Test that pattern tables are compiled once per class, not per instance."""
+        first, second = DomainClassifier(), DomainClassifier()
+        assert first._compiled_patterns is second._compiled_patterns
+        assert first._score_cache is not second._score_cache
+
+
+class TestHyperscanBackend:
+    """Test the optional Hyperscan regex backend."""
+
+    DESCRIPTION = "prove the categorical correctness of the pipeline"
+
+    @staticmethod
+    def _new_classifier(monkeypatch, **failures):
+        """Create a classifier whose pattern tables are compiled with a fake hyperscan."""
+        monkeypatch.setitem(sys.modules, "hyperscan", _fake_hyperscan(**failures))
+        # A fresh subclass, so the per-class pattern tables are compiled again
+        return type("HyperscanClassifier", (DomainClassifier,), {})()
+
+    def test_match_ids_map_to_domain_and_weight(self, monkeypatch, classifier):
+        """Test that Hyperscan pattern ids map back to (domain id, weight)."""
+        hs_classifier = self._new_classifier(monkeypatch)
+        category_theory = hs_classifier._domains.index("category-theory")
+
+        assert hs_classifier._hyperscan is not None
+        assert hs_classifier._match_regex_patterns(self.DESCRIPTION) == [(category_theory, 8)]
+        assert hs_classifier._match_regex_patterns(self.DESCRIPTION) == \
+            classifier._match_regex_patterns(self.DESCRIPTION)
+
+    def test_compile_error_falls_back_to_re(self, monkeypatch, classifier):
+        """Test that a rejected pattern disables Hyperscan for the class."""
+        hs_classifier = self._new_classifier(monkeypatch, fail_compile=True)
+        task = Task(description=self.DESCRIPTION, task_id="t1")
+
+        assert hs_classifier._hyperscan is None
+        assert hs_classifier.classify(task) == classifier.classify(task)
+
+    def test_scan_error_falls_back_to_re(self, monkeypatch, classifier):
+        """Test that a failing scan is answered by the re patterns."""
+        hs_classifier = self._new_classifier(monkeypatch, fail_scan=True)
+
+        assert hs_classifier._hyperscan is not None
+        assert hs_classifier._match_regex_patterns(self.DESCRIPTION) == \
+            classifier._match_regex_patterns(self.DESCRIPTION)
@@ -0,0 +1,98 @@
+"""
+Unit tests for HierarchicalRouter tier selection.
+"""
+
+import pytest
+
+from src.entities import Agent, Task
+from src.routing.hierarchical_router import HierarchicalRouter, _required_prefix
+
+
+@pytest.fixture
+def router():
+    return HierarchicalRouter()
+
+
+class TestDetermineTier:
+    """Test tier detection from task descriptions."""
+
+    @pytest.mark.parametrize("description", [
+        "Plan the next release",
+        "Coordinate the frontend work",
+        "Define the overall product strategy",
+        "Run a Code Review of the parser",
+    ])
+    def test_tier_1_patterns(self, router, description):
+        assert router._determine_tier(Task(description=description), "general") == 1
+
+    @pytest.mark.parametrize("description", [
+        "Design the cache layer",
+        "Write the api design document",
+        "Outline the test architecture",
+    ])
+    def test_tier_2_patterns(self, router, description):
+        assert router._determine_tier(Task(description=description), "general") == 2
+
+    def test_whole_word_patterns_need_word_boundaries(self, router):
+        # "planet" must not match r"\bplan\b", nor "designer" r"\bdesign\b"
+        task = Task(description="Implement the planet designer widget")
+        assert router._determine_tier(task, "general") == 3
+
+    def test_implementation_defaults_to_tier_3(self, router):
+        assert router._determine_tier(Task(description="Fix the login bug"), "general") == 3
+
+
+class TestSelectAgent:
+    """Test agent selection within a tier."""
+
+    @pytest.fixture
+    def agents(self):
+        return [
+            Agent(role="backend-lead", capabilities=["design"], tier=2, specialization="backend"),
+            Agent(role="frontend-lead", capabilities=["design"], tier=2, specialization="frontend"),
+            Agent(role="python-specialist", capabilities=["python"], tier=3, specialization="backend"),
+            Agent(role="coder", capabilities=["python", "code"], tier=3),
+        ]
+
+    def test_prefers_domain_match_in_tier(self, router, agents):
+        task = Task(description="Design the frontend layout")
+        assert router.route(task, agents).role == "frontend-lead"
+
+    def test_falls_back_to_any_agent_in_tier(self, router, agents):
+        task = Task(description="Write python code for the docker setup")
+        assert router.route(task, agents).role == "python-specialist"
+
+    def test_batch_routing_matches_single_routing(self, router, agents):
+        tasks = [
+            Task(description="Design the frontend layout"),
+            Task(description="Write python code for the docker setup"),
+        ]
+        batch = [agent.role for _, agent in router.route_batch(tasks, agents)]
+        assert batch == [router.route(task, agents).role for task in tasks]
+
+    def test_quiet_batch_skips_orchestration_mode(self, router, agents):
+        router.route_batch([Task(description="Design the frontend layout")], agents)
+        assert router.orchestrator_router._pattern_cache.cache_info().misses == 0
+
+        router.route_batch([Task(description="Design the frontend layout")], agents, verbose=True)
+        assert router.orchestrator_router._pattern_cache.cache_info().misses > 0
+
+    def test_batch_routing_reuses_agent_for_repeated_description(self, router, agents):
+        tasks = [Task(description="Design the frontend layout", task_id=f"t{i}") for i in range(3)]
+        routes = router.route_batch(tasks, agents)
+        assert [task.task_id for task, _ in routes] == ["t0", "t1", "t2"]
+        assert {agent.role for _, agent in routes} == {"frontend-lead"}
+
+
+@pytest.mark.parametrize("pattern,prefix", [
+    (r"sprint.*backlog", "sprint"),
+    (r"\bqa\b lead", "qa"),
+    (r"tests?", "test"),
+    (r"(plan|design)", ""),
+])
+def test_required_prefix(pattern, prefix):
+    assert _required_prefix(pattern) == prefix
+
+
+def test_tier_matchers_shared_between_instances():
+    assert HierarchicalRouter()._tier_1_matchers is HierarchicalRouter()._tier_1_matchers
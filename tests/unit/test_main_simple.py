@@ -171,4 +171,123 @@ class TestMainCLI:
 
         # Should fail - file doesn't exist
         assert result.exit_code != 0
-        assert 'does not exist' in result.output.lower() or 'invalid' in result.output.lower()
\ No newline at end of file
+        assert 'does not exist' in result.output.lower() or 'invalid' in result.output.lower()
+
+
+class TestAgentCaching:
+    """Test opt-in agent memoization (UI_CLI_CACHE=1)."""
+
+    def test_cached_agents_reused_in_fresh_lists(self):
+        """Test that cached mode returns new lists over the same agents."""
+        from src.main import _cached_factories, _create_agents
+
+        agent_factory, _ = _cached_factories()
+        first = _create_agents(agent_factory, "extended", use_cache=True)
+        second = _create_agents(agent_factory, "extended", use_cache=True)
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        assert len(first) == 8
+
+    def test_uncached_agents_are_fresh(self):
+        """Test that without caching each call builds new agents."""
+        from src.main import _new_factories, _create_agents
+
+        agent_factory, _ = _new_factories()
+        first = _create_agents(agent_factory, "default", use_cache=False)
+        second = _create_agents(agent_factory, "default", use_cache=False)
+
+        assert first[0] is not second[0]
+
+
+class TestTrivialTasks:
+    """Test the health-check fast path."""
+
+    def test_ping_short_circuits(self):
+        """Test that a lone 'ping' task succeeds without composing dependencies."""
+        from unittest.mock import patch
+
+        runner = CliRunner()
+        with patch("src.composition.compose_dependencies") as compose:
+            result = runner.invoke(main, ['--task', 'ping'])
+
+        assert result.exit_code == 0
+        assert "Status: success" in result.output
+        compose.assert_not_called()
+
+    def test_ping_reports_unavailable_provider(self, monkeypatch):
+        """Test that 'ping' fails when the provider's availability probe fails."""
+        from unittest.mock import patch
+
+        from src.factories.provider_creators import reset_env_cache
+
+        monkeypatch.delenv("XAI_API_KEY", raising=False)
+        monkeypatch.setattr("src.main._load_env_once", lambda: None)
+        reset_env_cache()
+
+        runner = CliRunner()
+        try:
+            with patch("src.composition.compose_dependencies") as compose:
+                result = runner.invoke(main, ['--task', 'ping', '--provider', 'grok'])
+        finally:
+            reset_env_cache()
+
+        assert "Status: failure" in result.output
+        assert "grok" in result.output
+        compose.assert_not_called()
+
+
+class TestProviderPool:
+    """Test the per-run provider pool."""
+
+    def test_pooled_providers_closed_before_loop_exits(self):
+        """Test that each run closes its own pool inside the event loop."""
+        from unittest.mock import AsyncMock, patch
+
+        runner = CliRunner()
+        with patch("src.factories.provider_factory.ProviderFactory.close_all",
+                   new_callable=AsyncMock) as close_all:
+            for _ in range(2):
+                result = runner.invoke(main, ['--task', 'Say hello', '--provider', 'mock'])
+                assert result.exit_code == 0
+
+        assert close_all.await_count == 2
+
+
+class TestWiringCaching:
+    """Test that UI_CLI_CACHE=1 reuses agents/teams but not providers."""
+
+    def test_cached_teams_reused_across_runs(self):
+        """Test that cached mode returns the same agents and teams on each build."""
+        from src.main import _build_agents, _cached_factories
+
+        agent_factory, team_factory = _cached_factories()
+        logger = logging.getLogger()
+        first = _build_agents("team", "scaled", agent_factory, team_factory, True, logger)
+        second = _build_agents("team", "scaled", agent_factory, team_factory, True, logger)
+
+        assert all(a is b for a, b in zip(first[1], second[1]))
+        assert all(a is b for a, b in zip(first[0], second[0]))
+        assert len(first[0]) == 16
+
+    def test_cached_mode_creates_provider_per_run(self, monkeypatch):
+        """Test that each run gets its own provider even with caching on."""
+        from unittest.mock import patch
+        from src.factories.provider_factory import ProviderFactory
+
+        monkeypatch.setenv("UI_CLI_CACHE", "1")
+        created = []
+        original = ProviderFactory.create_provider
+
+        def record(self, provider_type, config=None):
+            created.append(original(self, provider_type, config))
+            return created[-1]
+
+        runner = CliRunner()
+        with patch.object(ProviderFactory, "create_provider", record):
+            for _ in range(2):
+                result = runner.invoke(main, ['--task', 'Say hello', '--provider', 'mock'])
+                assert result.exit_code == 0
+
+        assert len(created) == 2
+        assert created[0] is not created[1]
@@ -0,0 +1,69 @@
+"""
+Unit tests for ModelSelector task analysis and selection.
+"""
+
+import pytest
+
+from src.routing.model_selector import ModelSelector, ScoringWeights, SelectionCriteria
+
+
+@pytest.fixture
+def selector():
+    return ModelSelector()
+
+
+class TestAnalyzeTaskRequirements:
+    """Test keyword-based criteria inference."""
+
+    @pytest.mark.parametrize("description,expected", [
+        ("Summarize this confidential report", SelectionCriteria.PRIVACY),
+        ("Run it locally", SelectionCriteria.PRIVACY),
+        ("Need a quick answer", SelectionCriteria.SPEED),
+        ("Real-time dashboard", SelectionCriteria.SPEED),
+        ("Critical production fix", SelectionCriteria.QUALITY),
+        ("Keep it cost-effective", SelectionCriteria.COST),
+        ("Quick offline lookup", SelectionCriteria.PRIVACY),
+    ])
+    def test_keywords_select_criteria(self, selector, description, expected):
+        result = selector._analyze_task_requirements(description, SelectionCriteria.BALANCED)
+        assert result == expected
+
+    def test_no_keywords_keep_default(self, selector):
+        result = selector._analyze_task_requirements("Write a parser", SelectionCriteria.QUALITY)
+        assert result == SelectionCriteria.QUALITY
+
+    def test_repeated_description_is_analyzed_once(self, selector):
+        for _ in range(3):
+            selector._analyze_task_requirements("Need a quick answer", SelectionCriteria.BALANCED)
+        info = selector._keyword_cache.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+
+class TestSelectModel:
+    """Test model selection by criteria."""
+
+    def test_privacy_selects_local_model(self, selector):
+        assert selector.select_model(SelectionCriteria.PRIVACY) == "tongyi-local"
+
+    def test_description_overrides_criteria(self, selector):
+        selected = selector.select_model(SelectionCriteria.QUALITY, task_description="run offline")
+        assert selected == "tongyi-local"
+
+    def test_unavailable_providers_raise(self, selector):
+        with pytest.raises(ValueError):
+            selector.select_model(available_providers=["missing"])
+
+    def test_custom_weights_change_balanced_choice(self):
+        weights = ScoringWeights(
+            quality_weight=0.0, speed_weight=0.0, cost_weight=0.0, privacy_weight=1.0
+        )
+        assert ModelSelector(scoring_weights=weights).select_model() == "tongyi-local"
+
+    def test_score_tables_are_computed_once(self, selector):
+        selector.select_model(SelectionCriteria.SPEED)
+        selector.select_model(SelectionCriteria.SPEED, available_providers=["grok", "tongyi-local"])
+        assert list(selector._score_tables) == [(SelectionCriteria.SPEED, None)]
+
+    def test_fallback_chain(self, selector):
+        chain = selector.get_fallback_chain("grok", SelectionCriteria.PRIVACY)
+        assert chain == ["grok", "tongyi-local", "qwen3_zerogpu"]
@@ -0,0 +1,84 @@
+"""Unit tests for orchestration factory (orchestration_factory.py)."""
+
+import pytest
+from unittest.mock import Mock
+
+from src.entities import Agent
+from src.interfaces import ITextGenerator, IAgentExecutor, ITaskPlanner
+from src.factories.orchestration_factory import (
+    OrchestrationFactory,
+    OrchestrationMode,
+    create_orchestrator,
+    is_mode_available,
+)
+from src.use_cases.task_coordinator import TaskCoordinatorUseCase
+
+
+@pytest.fixture
+def dependencies():
+    """Minimal orchestrator dependencies."""
+    return {
+        "llm_provider": Mock(spec=ITextGenerator),
+        "task_planner": Mock(spec=ITaskPlanner),
+        "agent_executor": Mock(spec=IAgentExecutor),
+        "agents": [Agent(role="coder", capabilities=["code"])],
+    }
+
+
+class TestCreateOrchestrator:
+    """Test mode dispatch in create_orchestrator."""
+
+    def test_simple_mode_returns_task_coordinator(self, dependencies):
+        """Test that simple mode builds TaskCoordinatorUseCase."""
+        orchestrator = create_orchestrator(mode="simple", **dependencies)
+
+        assert isinstance(orchestrator, TaskCoordinatorUseCase)
+
+    def test_mode_is_case_insensitive(self, dependencies):
+        """Test that mode names are matched case-insensitively."""
+        orchestrator = create_orchestrator(mode="SIMPLE", **dependencies)
+
+        assert isinstance(orchestrator, TaskCoordinatorUseCase)
+
+    def test_unsupported_mode_raises_error(self, dependencies):
+        """Test that unknown modes raise ValueError listing supported modes."""
+        with pytest.raises(ValueError, match="Supported modes: simple"):
+            create_orchestrator(mode="unknown", **dependencies)
+
+    def test_accepts_orchestration_mode_enum(self, dependencies):
+        """Test that OrchestrationMode members are accepted as mode."""
+        orchestrator = create_orchestrator(mode=OrchestrationMode.SIMPLE, **dependencies)
+
+        assert isinstance(orchestrator, TaskCoordinatorUseCase)
+        assert OrchestrationMode.SIMPLE == "simple"
+
+    def test_class_wrapper_delegates_to_function(self, dependencies):
+        """Test backward-compatible OrchestrationFactory namespace."""
+        orchestrator = OrchestrationFactory.create_orchestrator(mode="simple", **dependencies)
+
+        assert isinstance(orchestrator, TaskCoordinatorUseCase)
+
+
+class TestModeAvailability:
+    """Test mode availability helpers."""
+
+    def test_simple_and_hybrid_always_available(self):
+        """Test that simple and hybrid modes are always available."""
+        assert is_mode_available("simple")
+        assert is_mode_available("Hybrid")
+
+    def test_unknown_mode_unavailable(self):
+        """Test that unknown modes are reported unavailable."""
+        assert not is_mode_available("unknown")
+
+
+class TestHybridMode:
+    """Test hybrid mode degradation without SDK."""
+
+    def test_hybrid_without_sdk_returns_simple_orchestrator(self, dependencies, monkeypatch):
+        """Test that hybrid degrades to the simple orchestrator when SDK is disabled."""
+        monkeypatch.setenv("DISABLE_SDK_MODE", "true")
+
+        orchestrator = create_orchestrator(mode="hybrid", **dependencies)
+
+        assert isinstance(orchestrator, TaskCoordinatorUseCase)
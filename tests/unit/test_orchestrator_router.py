@@ -0,0 +1,61 @@
+"""
+Unit tests for OrchestratorRouter mode selection.
+"""
+
+import pytest
+
+from src.entities import Task
+from src.routing.orchestrator_router import OrchestratorRouter
+
+
+@pytest.fixture
+def router():
+    return OrchestratorRouter()
+
+
+class TestRoute:
+    """Test orchestration mode decisions."""
+
+    def test_multi_agent_task_uses_simple_mode(self, router):
+        task = Task(description="Research caching then implement it", task_id="t1")
+        assert router.route(task) == "simple"
+
+    def test_review_task_uses_simple_mode(self, router):
+        task = Task(description="Review code in the parser module", task_id="t1")
+        assert router.route(task) == "simple"
+
+    def test_patterns_ignore_case(self, router):
+        task = Task(description="Check SOLID principles in the parser", task_id="t1")
+        assert router.route(task) == "simple"
+
+    def test_single_agent_task_uses_sdk(self, router):
+        task = Task(description="Fix the login bug", task_id="t1")
+        assert router.route(task) == "openai-agents"
+
+    def test_sdk_disabled_always_simple(self):
+        task = Task(description="Fix the login bug", task_id="t1")
+        assert OrchestratorRouter(enable_sdk=False).route(task) == "simple"
+
+
+def test_route_stops_at_first_deciding_characteristic(router):
+    router.route(Task(description="Research caching then implement it", task_id="t1"))
+    assert router._pattern_cache.cache_info().misses == 1
+
+
+def test_routing_stats_reuse_route_scans(router):
+    """get_routing_stats scans each characteristic of a description at most once."""
+    tasks = [
+        Task(description="Research caching then implement it", task_id="t1"),
+        Task(description="Fix the login bug", task_id="t2"),
+    ]
+    stats = router.get_routing_stats(tasks)
+
+    assert stats["sdk_mode"] == 1
+    assert stats["characteristics"]["multi_agent"] == 1
+    assert stats["characteristics"]["research"] == 1
+    info = router._pattern_cache.cache_info()
+    assert (info.misses, info.hits) == (6, 3)
+
+
+def test_compiled_patterns_shared_between_instances():
+    assert OrchestratorRouter()._review_regex is OrchestratorRouter()._review_regex
@@ -0,0 +1,49 @@
+"""Unit tests for CLI result formatter (result_formatter.py)."""
+
+from unittest.mock import patch
+
+from src.adapters.cli import ResultFormatter
+from src.entities import ExecutionResult, ExecutionStatus
+
+
+def _results():
+    return [
+        ExecutionResult(status=ExecutionStatus.SUCCESS, output="done", metadata={"agent": "coder"}),
+        ExecutionResult(status=ExecutionStatus.FAILURE, output="", errors=["timeout", "retry"]),
+    ]
+
+
+class TestFormatResults:
+    """Test result display."""
+
+    def test_results_written_in_one_echo(self):
+        """Test that plain results are buffered into a single write."""
+        with patch("src.adapters.cli.result_formatter.click.echo") as echo:
+            ResultFormatter().format_results(_results())
+
+        assert echo.call_count == 1
+
+    def test_output_content(self, capsys):
+        """Test headers, status, output, errors and verbose metadata."""
+        ResultFormatter(verbose=True).format_results(_results())
+
+        out = capsys.readouterr().out
+        assert "Result #1" in out and "Result #2" in out
+        assert "Status: success" in out
+        assert "Output: done" in out
+        assert "Errors: timeout, retry" in out
+        assert "Metadata: {'agent': 'coder'}" in out
+
+    def test_metadata_hidden_when_not_verbose(self, capsys):
+        """Test that metadata is only shown in verbose mode."""
+        ResultFormatter().format_results(_results())
+
+        assert "Metadata" not in capsys.readouterr().out
+
+    def test_long_output_truncated(self, capsys):
+        """Test that long output is truncated unless verbose."""
+        result = ExecutionResult(status=ExecutionStatus.SUCCESS, output="x" * 3000)
+
+        ResultFormatter().format_results([result])
+
+        assert "(2000 chars truncated)" in capsys.readouterr().out
@@ -0,0 +1,132 @@
+"""Unit tests for team factory (team_factory.py)."""
+
+import pytest
+
+from src import entities
+from src.entities import Agent, AgentTeam, BackendTeam
+from src.factories.team_factory import TeamFactory
+
+
+@pytest.fixture
+def factory():
+    """Create team factory with default agent factory."""
+    return TeamFactory()
+
+
+class TestCreateTeams:
+    """Test team construction from agent configurations."""
+
+    def test_scaled_teams_structure(self, factory):
+        """Test that scaled mode builds 9 teams covering 16 agents."""
+        teams = factory.create_scaled_teams()
+
+        assert [team.name for team in teams] == [
+            "Orchestration", "Quality Assurance", "Frontend", "Backend", "Testing",
+            "Infrastructure", "Research", "Category Theory", "DSL",
+        ]
+        assert sum(len(team.agents) for team in teams) == 16
+
+    def test_scaled_testing_team_has_lead_and_specialists(self, factory):
+        """Test that team blueprints keep lead first, then specialists."""
+        testing = next(team for team in factory.create_scaled_teams() if team.name == "Testing")
+
+        assert isinstance(testing, entities.TestingTeam)
+        assert testing.lead_agent.role == "testing-lead"
+        assert [agent.role for agent in testing.agents] == [
+            "testing-lead", "unit-test-engineer", "integration-test-engineer",
+        ]
+        assert testing.tier == 2
+
+    def test_extended_teams_use_self_led_phase1_teams(self, factory):
+        """Test that extended mode builds 7 teams with self-led tier 3 teams."""
+        teams = factory.create_extended_teams()
+        testing = next(team for team in teams if team.name == "Testing")
+
+        assert len(teams) == 7
+        assert [agent.role for agent in testing.agents] == ["unit-test-engineer"]
+        assert testing.tier == 3
+
+    def test_default_teams_wrap_each_agent(self, factory):
+        """Test that default mode wraps each agent in its own team."""
+        teams = factory.create_default_teams()
+
+        assert [team.domain for team in teams] == [
+            "backend", "testing", "quality", "general", "research",
+        ]
+        assert all(len(team.agents) == 1 for team in teams)
+
+    def test_team_skipped_when_lead_missing(self):
+        """Test that a team is not created when its lead role is absent."""
+        class PartialAgentFactory:
+            def create_scaled_agents(self):
+                return [Agent(role="python-specialist", capabilities=["python"])]
+
+        teams = TeamFactory(PartialAgentFactory()).create_scaled_teams()
+
+        assert teams == []
+
+
+class TestTeamUtilities:
+    """Test team flattening and summary helpers."""
+
+    def test_get_all_agents_preserves_order(self, factory):
+        """Test flattening teams keeps team and agent order."""
+        teams = factory.create_scaled_teams()
+
+        agents = factory.get_all_agents_from_teams(teams)
+
+        assert agents == [agent for team in teams for agent in team.agents]
+
+    def test_team_summary(self, factory):
+        """Test summary statistics over scaled teams."""
+        summary = factory.get_team_summary(factory.create_scaled_teams())
+
+        assert summary["team_count"] == 9
+        assert summary["total_agents"] == 16
+        assert summary["teams_with_leads"] == 9
+        assert sum(summary["tier_distribution"].values()) == 16
+        assert summary["average_team_size"] == pytest.approx(16 / 9)
+
+    def test_team_summary_empty(self, factory):
+        """Test summary of no teams."""
+        summary = factory.get_team_summary([])
+
+        assert summary["team_count"] == 0
+        assert summary["average_team_size"] == 0
+
+    def test_backend_team_class_preserved(self, factory):
+        """Test that team specs instantiate the domain-specific team class."""
+        backend = next(team for team in factory.create_scaled_teams() if team.name == "Backend")
+
+        assert isinstance(backend, BackendTeam)
+        assert isinstance(backend, AgentTeam)
+
+
+class TestTeamCaching:
+    """Test memoization of created teams."""
+
+    def test_repeated_calls_reuse_teams(self, factory):
+        """Test that repeated calls return the same team objects in fresh lists."""
+        first = factory.create_scaled_teams()
+        second = factory.create_scaled_teams()
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_invalidate_cache_rebuilds_teams(self, factory):
+        """Test that invalidate_cache() forces new team objects."""
+        first = factory.create_default_teams()
+        factory.invalidate_cache()
+
+        assert factory.create_default_teams()[0] is not first[0]
+
+    def test_agent_factory_created_lazily(self):
+        """Test that the default agent factory is only built when needed."""
+        factory = TeamFactory()
+
+        assert factory._agent_factory is None
+        factory.get_team_summary([])
+        assert factory._agent_factory is None
+
+        factory.create_default_teams()
+        assert factory._agent_factory is not None
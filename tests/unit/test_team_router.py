@@ -0,0 +1,76 @@
+"""
+Unit tests for TeamRouter team selection.
+"""
+
+import pytest
+
+from src.entities import Agent, AgentTeam, Task
+from src.routing.team_router import TeamRouter
+
+
+@pytest.fixture
+def router():
+    """Create a team router."""
+    return TeamRouter()
+
+
+@pytest.fixture
+def teams():
+    """Create orchestration, frontend and testing teams."""
+    orchestrator = Agent(role="master-orchestrator", capabilities=["plan"], tier=1)
+    frontend_lead = Agent(role="frontend-lead", capabilities=["react"], tier=2)
+    test_engineer = Agent(role="unit-test-engineer", capabilities=["pytest"], tier=3)
+    return [
+        AgentTeam(name="Orchestration", domain="general", agents=[orchestrator], tier=1),
+        AgentTeam(name="Frontend", domain="frontend", agents=[frontend_lead]),
+        AgentTeam(name="Testing Squad", domain="testing", agents=[test_engineer], tier=3),
+    ]
+
+
+class TestSelectTeam:
+    """Test domain to team selection."""
+
+    def test_domain_maps_to_team_name(self, router, teams):
+        """Test that a classified domain selects the team named for it."""
+        task = Task(description="Build a React component with CSS styling")
+        assert router.route(task, teams).role == "frontend-lead"
+
+    def test_falls_back_to_team_domain(self, router, teams):
+        """Test that a team is found by its domain when no name matches."""
+        task = Task(description="Write pytest unit tests with coverage")
+        assert router.route(task, teams).role == "unit-test-engineer"
+
+    def test_unmapped_team_falls_back_to_orchestration(self, router, teams):
+        """Test that a domain without a team routes to the orchestration team."""
+        task = Task(description="Deploy with Docker and Kubernetes")
+        assert router.route(task, teams).role == "master-orchestrator"
+
+    def test_no_teams_raises(self, router):
+        """Test that routing without teams raises ValueError."""
+        with pytest.raises(ValueError):
+            router.route(Task(description="Deploy with Docker"), [])
+
+
+class TestRouteBatch:
+    """Test batch routing."""
+
+    def test_route_batch_matches_single_routing(self, router, teams):
+        """Test that route_batch picks the same agents as route, with their teams."""
+        tasks = [
+            Task(description="Build a React component with CSS styling", task_id="t1"),
+            Task(description="Write pytest unit tests with coverage", task_id="t2"),
+            Task(description="Deploy with Docker and Kubernetes", task_id="t3"),
+        ]
+        routes = router.route_batch(tasks, teams)
+        assert [agent for _, _, agent in routes] == [router.route(task, teams) for task in tasks]
+        team_names = [team.name for _, team, _ in routes]
+        assert team_names == ["Frontend", "Testing Squad", "Orchestration"]
+
+    def test_agent_in_several_teams_reports_first_team(self, router, teams):
+        """Test that an agent shared by several teams is reported with the first."""
+        shared = teams[1].agents[0]
+        teams.append(AgentTeam(name="UI Guild", domain="ui", agents=[shared]))
+        task = Task(description="Build a React component with CSS styling")
+
+        routes = router.route_batch([task], teams)
+        assert routes[0][1].name == "Frontend"